@@ -1,11 +1,62 @@
-def naive_linechunk(text, chunk_size):
+import io
+import itertools
+from typing import Iterator, List
+
+
+def iter_linechunks(text: str, chunk_size: int) -> Iterator[str]:
+    """
+    Lazily yields chunks of approximately `chunk_size` lines from the input text.
+
+    Only one chunk is joined at a time, so callers that stop early (or process
+    chunks one by one) never materialize the full list of chunks.
+
+    Args:
+        text (str): The text to split.
+        chunk_size (int): Number of lines per chunk.
+
+    Yields:
+        str: Text chunks.
+    """
+    lines = iter(text.splitlines())
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield "\n".join(chunk)
+
+
+def iter_linechunks_stream(text: str, chunk_size: int) -> Iterator[str]:
+    """
+    Streams chunks of `chunk_size` lines without building a list of all lines.
+
+    Lines are read one at a time from an in-memory buffer, so memory stays
+    proportional to a single chunk even for very large documents. Unlike
+    `iter_linechunks`, only "\n" is treated as a line break and each line keeps
+    its trailing newline, so chunks are joined with "".
+
+    Args:
+        text (str): The text to split.
+        chunk_size (int): Number of lines per chunk.
+
+    Yields:
+        str: Text chunks.
+    """
+    buf = io.StringIO(text)
+    while True:
+        chunk = "".join(itertools.islice(buf, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def naive_linechunk(text: str, chunk_size: int) -> List[str]:
     """
     Splits the input text into chunks of approximately `chunk_size` lines.
 
     This function is very naive and does not take into account the length of
     individual lines. It is mainly useful for small chunks and for testing
     purposes. If you need to split large texts, you should use a more
-    sophisticated algorithm.
+    sophisticated algorithm, or `iter_linechunks` to consume chunks lazily.
 
     Args:
         text (str): The text to split.
@@ -14,8 +65,4 @@ def naive_linechunk(text, chunk_size):
     Returns:
         List[str]: List of text chunks.
     """
-    lines = text.splitlines()
-    return [
-        "\n".join(lines[i:i + chunk_size])
-        for i in range(0, len(lines), chunk_size)
-    ]
+    return list(iter_linechunks(text, chunk_size))
@@ -1,3 +1,9 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Sequence, Tuple
+
+
 class Executor:
     """
     Base class for all executors.
@@ -18,3 +24,23 @@ class Executor:
         - Dict[str, Any]: The outputs of the agent.
         """
         raise NotImplementedError
+
+    async def execute_many(
+        self, runs: Sequence[Tuple[Agent, Dict[str, Any]]]
+    ) -> List[Any]:
+        """
+        Execute several agents concurrently on the running event loop.
+
+        All executions are scheduled together so their I/O is interleaved
+        within the same loop iterations instead of running one after another.
+
+        Args:
+        - runs (Sequence[Tuple[Agent, Dict[str, Any]]]): (agent, inputs) pairs.
+
+        Returns:
+        - List[Any]: Outputs in input order; failed runs yield their exception.
+        """
+        return await asyncio.gather(
+            *(self.execute(agent, inputs) for agent, inputs in runs),
+            return_exceptions=True,
+        )
@@ -19,17 +19,36 @@ Features:
 - Error handling and logging
 """
 
+import asyncio
+import hashlib
 import logging
+import pickle
 import time
-from typing import Any, Dict, Optional, Union, List, Callable
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Dict, Optional, List, Callable
 from functools import wraps
 import aiohttp
+import orjson
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Status codes that are worth retrying (throttling and transient server errors)
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_BACKOFF = 10.0
+
+# Sentinel for cache misses, so a hit costs a single lookup
+_MISS = object()
+
+def _orjson_dumps(obj: Any) -> str:
+    """Serialize request bodies with orjson (aiohttp expects a str)."""
+    return orjson.dumps(obj).decode()
+
 class APIError(Exception):
     """Custom exception for API-related errors."""
     def __init__(self, message: str, status_code: Optional[int] = None):
@@ -37,6 +56,65 @@ class APIError(Exception):
         self.status_code = status_code
         super().__init__(message)
 
+class RateLimited(APIError):
+    """Raised on HTTP 429, carrying the server's Retry-After hint."""
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        self.retry_after = retry_after
+        super().__init__(message, 429)
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header into seconds to wait.
+
+    Args:
+        value (str, optional): Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        float, optional: Seconds to wait, or None if absent or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+class TokenBucket:
+    """Async token-bucket limiter shared cooperatively by many coroutines."""
+
+    def __init__(self, rate: float, max_tokens: int):
+        """Initialize the bucket.
+
+        Args:
+            rate (float): Tokens added per second
+            max_tokens (int): Bucket capacity (maximum burst size)
+        """
+        self.rate = rate
+        self.max_tokens = max_tokens
+        self._tokens = float(max_tokens)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self._tokens + (now - self._updated_at) * self.rate, self.max_tokens)
+        self._updated_at = now
+
+    async def wait_for_token(self) -> None:
+        """Wait without blocking the event loop until a token is available."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep(1 / self.rate)
+                self._refill()
+            self._tokens -= 1
+
 class APITools:
     """Class containing various API-related utility functions."""
 
@@ -46,7 +124,8 @@ class APITools:
         api_key: Optional[str] = None,
         max_retries: int = 3,
         cache_ttl: int = 300,  # 5 minutes
-        cache_maxsize: int = 1000
+        cache_maxsize: int = 1000,
+        backoff_factor: float = 1.0
     ):
         """Initialize API tools with configuration.
 
@@ -56,11 +135,74 @@ class APITools:
             max_retries (int): Maximum number of retry attempts
             cache_ttl (int): Cache time-to-live in seconds
             cache_maxsize (int): Maximum size of cache
+            backoff_factor (float): Base delay for exponential retry backoff
         """
         self.base_url = base_url.rstrip('/')
+        self._base_slash = self.base_url + '/'
         self.api_key = api_key
         self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
         self.cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Pooled keep-alive session for sync calls. Retries and backoff are
+        # handled by urllib3 inside the adapter; raise_on_status is off so the
+        # final response still goes through _validate_response.
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=None,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self._sync_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max(max_retries, 1),
+            pool_maxsize=64,
+            max_retries=retry
+        )
+        self._sync_session.mount('http://', adapter)
+        self._sync_session.mount('https://', adapter)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: Pooled session reused across async requests
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30),
+                json_serialize=_orjson_dumps
+            )
+        return self._session
+
+    def close(self) -> None:
+        """Close the pooled sync session."""
+        self._sync_session.close()
+
+    async def aclose(self) -> None:
+        """Close the shared aiohttp session and release pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _build_url(self, endpoint: Optional[str]) -> str:
+        """Join an endpoint onto the precomputed base URL.
+
+        Args:
+            endpoint (str, optional): API endpoint
+
+        Returns:
+            str: Absolute request URL
+        """
+        if not endpoint:
+            return self._base_slash
+        if endpoint[0] == '/':
+            endpoint = endpoint.lstrip('/')
+        return self._base_slash + endpoint
 
     def _build_headers(self, additional_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """Build request headers.
@@ -82,8 +224,33 @@ class APITools:
             headers.update(additional_headers)
         return headers
 
-    def _validate_response(self, response: Union[requests.Response, aiohttp.ClientResponse]) -> None:
-        """Validate API response.
+    def _raise_api_error(
+        self,
+        status_code: int,
+        content: str,
+        retry_after: Optional[str] = None
+    ) -> None:
+        """Log and raise an APIError for a failed response.
+
+        Args:
+            status_code (int): HTTP status code
+            content (str): Leading part of the response body
+            retry_after (str, optional): Retry-After header of the response
+
+        Raises:
+            RateLimited: If the status code is 429
+            APIError: For any other error status
+        """
+        error_msg = f"API Error {status_code}: {content[:200]}"
+        logger.error(error_msg)
+        if status_code == 429:
+            raise RateLimited(error_msg, parse_retry_after(retry_after))
+        raise APIError(error_msg, status_code)
+
+    def _validate_response(self, response: requests.Response) -> None:
+        """Validate a sync API response.
+
+        The body is only read when the status indicates an error.
 
         Args:
             response: API response object
@@ -91,23 +258,31 @@ class APITools:
         Raises:
             APIError: If response status code indicates an error
         """
-        if isinstance(response, requests.Response):
-            status_code = response.status_code
-            content = response.text
-        else:
-            status_code = response.status
-            content = response.text
-
-        if status_code >= 400:
-            error_msg = f"API Error {status_code}: {content[:200]}"
-            logger.error(error_msg)
-            raise APIError(error_msg, status_code)
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=(lambda e: isinstance(e, (requests.exceptions.RequestException, APIError)))
-    )
+        if response.status_code < 400:
+            return
+        self._raise_api_error(
+            response.status_code,
+            response.text,
+            response.headers.get('Retry-After')
+        )
+
+    async def _validate_async_response(self, response: aiohttp.ClientResponse) -> None:
+        """Validate an async API response.
+
+        On error only the first bytes of the body are read, leaving the
+        success path untouched for the caller to consume.
+
+        Args:
+            response: API response object
+
+        Raises:
+            APIError: If response status code indicates an error
+        """
+        if response.status < 400:
+            return
+        content = (await response.content.read(256)).decode('utf-8', 'replace')
+        self._raise_api_error(response.status, content, response.headers.get('Retry-After'))
+
     def make_request(
         self,
         method: str,
@@ -128,11 +303,11 @@ class APITools:
         Returns:
             dict: Parsed JSON response
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/') if endpoint else ''}"
+        url = self._build_url(endpoint)
         headers = self._build_headers(headers)
 
         try:
-            response = requests.request(
+            response = self._sync_session.request(
                 method,
                 url,
                 params=params,
@@ -141,7 +316,7 @@ class APITools:
                 timeout=30
             )
             self._validate_response(response)
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             logger.error(f"Request failed: {str(e)}")
             raise
@@ -166,24 +341,84 @@ class APITools:
         Returns:
             dict: Parsed JSON response
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/') if endpoint else ''}"
+        url = self._build_url(endpoint)
         headers = self._build_headers(headers)
 
-        async with aiohttp.ClientSession() as session:
+        for attempt in range(self.max_retries + 1):
             try:
-                async with session.request(
+                async with self._get_session().request(
                     method,
                     url,
                     params=params,
                     json=data,
-                    headers=headers,
-                    timeout=30
+                    headers=headers
                 ) as response:
-                    self._validate_response(response)
-                    return await response.json()
+                    await self._validate_async_response(response)
+                    return orjson.loads(await response.read())
+            except APIError as e:
+                if e.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    raise
+                # Sleep exactly as long as the server asked, when it told us
+                if isinstance(e, RateLimited) and e.retry_after is not None:
+                    await asyncio.sleep(e.retry_after)
+                    continue
             except aiohttp.ClientError as e:
-                logger.error(f"Async request failed: {str(e)}")
-                raise
+                if attempt == self.max_retries:
+                    logger.error(f"Async request failed: {str(e)}")
+                    raise
+            await asyncio.sleep(min(self.backoff_factor * (2 ** attempt), MAX_BACKOFF))
+
+    async def make_async_requests(
+        self,
+        requests_list: List[Dict[str, Any]],
+        max_concurrency: int = 50
+    ) -> List[Any]:
+        """Make many async HTTP requests concurrently over the shared session.
+
+        Args:
+            requests_list (list): Keyword arguments for each make_async_request call
+            max_concurrency (int): Maximum number of requests in flight at once
+
+        Returns:
+            list: Responses in input order; failed requests yield their exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(request_kwargs: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self.make_async_request(**request_kwargs)
+
+        return await asyncio.gather(
+            *(_one(request_kwargs) for request_kwargs in requests_list),
+            return_exceptions=True
+        )
+
+    @staticmethod
+    def _make_cache_key(name: str, args: tuple, kwargs: Dict) -> Any:
+        """Build a compact, hashable cache key for a function call.
+
+        Hashable arguments are used directly as a tuple; otherwise the call
+        is pickled and reduced to a 16-byte blake2b digest.
+
+        Args:
+            name (str): Function name
+            args (tuple): Positional arguments
+            kwargs (dict): Keyword arguments
+
+        Returns:
+            Any: Hashable cache key
+        """
+        key = (name, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+            return key
+        except TypeError:
+            pass
+        try:
+            payload = pickle.dumps((name, args, kwargs), protocol=5)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            payload = repr((name, args, kwargs)).encode()
+        return hashlib.blake2b(payload, digest_size=16).digest()
 
     def cache_response(
         self,
@@ -199,18 +434,62 @@ class APITools:
         """
         @wraps(func)
         def wrapper(*args, **kwargs):
-            cache_key = f"{func.__name__}:{args}:{kwargs}"
+            cache_key = self._make_cache_key(func.__name__, args, kwargs)
             
-            if cache_key in self.cache:
+            cached = self.cache.get(cache_key, _MISS)
+            if cached is not _MISS:
                 logger.debug(f"Cache hit for {cache_key}")
-                return self.cache[cache_key]
-            
+                return cached
+
             result = func(*args, **kwargs)
             self.cache[cache_key] = result
             return result
         
         return wrapper
 
+    async def cached_async(
+        self,
+        key: Any,
+        coro_fn: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return a cached async result, deduplicating concurrent misses.
+
+        While a value is being fetched, its pending future is stored in the
+        cache so that concurrent callers for the same key await the single
+        in-flight call instead of hitting the upstream API themselves.
+
+        Args:
+            key (Any): Hashable cache key
+            coro_fn (Callable): Zero-argument coroutine function producing the value
+
+        Returns:
+            Any: Cached or freshly fetched value
+        """
+        value = self.cache.get(key, _MISS)
+        if value is not _MISS:
+            if isinstance(value, asyncio.Future):
+                return await asyncio.shield(value)
+            logger.debug(f"Cache hit for {key}")
+            return value
+
+        future = asyncio.get_running_loop().create_future()
+        self.cache[key] = future
+        try:
+            result = await coro_fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            self.cache.pop(key, None)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting
+            future.exception()
+            self.cache.pop(key, None)
+            raise
+        future.set_result(result)
+        self.cache[key] = result
+        return result
+
     def rate_limit(
         self,
         calls: int = 1,
@@ -226,26 +505,57 @@ class APITools:
             Callable: Decorated function
         """
         def decorator(func: Callable) -> Callable:
-            call_times = []
-            
+            call_times = deque()
+
             @wraps(func)
             def wrapper(*args, **kwargs):
-                nonlocal call_times
-                
-                # Remove old timestamps
-                call_times = [t for t in call_times if time.time() - t < period]
-                
+                now = time.monotonic()
+
+                # Drop timestamps that have left the window
+                while call_times and now - call_times[0] >= period:
+                    call_times.popleft()
+
                 if len(call_times) >= calls:
-                    sleep_time = period - (time.time() - call_times[0])
+                    sleep_time = period - (now - call_times[0])
                     if sleep_time > 0:
                         logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
                         time.sleep(sleep_time)
-                
-                call_times.append(time.time())
+                    call_times.popleft()
+
+                call_times.append(time.monotonic())
                 return func(*args, **kwargs)
-            
+
             return wrapper
-        
+
+        return decorator
+
+    def async_rate_limit(
+        self,
+        rate: float = 1.0,
+        max_tokens: int = 1
+    ) -> Callable:
+        """Decorator to rate limit coroutines with a token bucket.
+
+        Unlike rate_limit, waiting happens via asyncio.sleep so the event
+        loop keeps serving other tasks.
+
+        Args:
+            rate (float): Number of calls allowed per second
+            max_tokens (int): Maximum burst of calls
+
+        Returns:
+            Callable: Decorated coroutine function
+        """
+        def decorator(func: Callable) -> Callable:
+            bucket = TokenBucket(rate, max_tokens)
+
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                await bucket.wait_for_token()
+                return await func(*args, **kwargs)
+
+            return wrapper
+
         return decorator
 
     def validate_response_data(
@@ -262,29 +572,35 @@ class APITools:
         Raises:
             ValueError: If any required field is missing
         """
-        missing_fields = [field for field in required_fields if field not in response]
+        missing_fields = set(required_fields) - response.keys()
         if missing_fields:
-            raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
+            raise ValueError(f"Missing required fields: {', '.join(sorted(missing_fields))}")
 
     def transform_response_data(
         self,
         response: Dict,
-        transformations: Dict[str, Callable]
+        transformations: Dict[str, Callable],
+        in_place: bool = False
     ) -> Dict:
         """Apply transformations to response data.
 
         Args:
             response (dict): Response data
             transformations (dict): Mapping of field names to transformation functions
+            in_place (bool): Mutate and return ``response`` instead of copying it
 
         Returns:
             dict: Transformed data
         """
-        transformed = response.copy()
-        for field, transform_func in transformations.items():
-            if field in transformed:
-                transformed[field] = transform_func(transformed[field])
-        return transformed
+        updates = {
+            field: transform_func(response[field])
+            for field, transform_func in transformations.items()
+            if field in response
+        }
+        if in_place:
+            response.update(updates)
+            return response
+        return {**response, **updates}
 
     def handle_api_error(
         self,
@@ -302,8 +618,8 @@ class APITools:
         """
         logger.error(f"API Error: {str(error)}")
         if isinstance(error, APIError):
-            if error.status_code == 429:  # Rate limit
-                logger.warning("Rate limit exceeded")
+            if isinstance(error, RateLimited):
+                logger.warning(f"Rate limit exceeded, retry after {error.retry_after}s")
             elif error.status_code >= 500:  # Server error
                 logger.warning("Server error occurred")
         return default_value
@@ -327,9 +643,28 @@ if __name__ == "__main__":
     def get_user_stats(user_id: str) -> Dict:
         return api.make_request('GET', f'users/{user_id}/stats')
 
+    # Example async rate-limited function
+    @api.async_rate_limit(rate=10, max_tokens=10)
+    async def get_async_user_data(user_id: str) -> Dict:
+        return await api.make_async_request('GET', f'users/{user_id}')
+
     # Example async usage
     async def fetch_async_data():
-        return await api.make_async_request('GET', 'data')
+        try:
+            return await api.make_async_request('GET', 'data')
+        finally:
+            await api.aclose()
+
+    # Example single-flight cached async call
+    async def fetch_cached_config():
+        return await api.cached_async('config', lambda: api.make_async_request('GET', 'config'))
+
+    # Example batched async requests
+    async def fetch_many_users(user_ids: List[str]):
+        return await api.make_async_requests(
+            [{'method': 'GET', 'endpoint': f'users/{user_id}'} for user_id in user_ids],
+            max_concurrency=20
+        )
 
     # Example error handling
     try:
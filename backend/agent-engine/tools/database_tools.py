@@ -22,19 +22,27 @@ Features:
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic
-from sqlalchemy import create_engine, text, func
+import threading
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Generic
+from sqlalchemy import (
+    create_engine, text, func, select, insert, update, inspect,
+    PrimaryKeyConstraint, UniqueConstraint
+)
+from sqlalchemy.engine import make_url
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session, scoped_session
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.sql import Select
 from cachetools import TTLCache
 from functools import wraps
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
+_MISS = object()
 Base = declarative_base()
 
 class DatabaseError(Exception):
@@ -53,7 +61,9 @@ class DatabaseTools(Generic[T]):
         pool_size: int = 5,
         max_overflow: int = 10,
         cache_ttl: int = 300,  # 5 minutes
-        cache_maxsize: int = 1000
+        cache_maxsize: int = 1000,
+        cache_shards: int = 8,
+        async_db_url: Optional[str] = None
     ):
         """Initialize database tools with configuration.
 
@@ -63,26 +73,63 @@ class DatabaseTools(Generic[T]):
             max_overflow (int): Maximum overflow size
             cache_ttl (int): Cache time-to-live in seconds
             cache_maxsize (int): Maximum size of cache
+            cache_shards (int): Number of independently locked cache shards
+            async_db_url (str, optional): Async driver URL; derived from db_url
+                (postgresql+asyncpg) when omitted
         """
         self.db_url = db_url
+        self.async_db_url = async_db_url
         self.pool_size = pool_size
         self.max_overflow = max_overflow
-        self.cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        # TTLCache is not thread-safe; shard it so concurrent sessions only
+        # contend on the lock of the shard their key hashes to.
+        shard_maxsize = max(cache_maxsize // cache_shards, 1)
+        self._shards = [
+            (TTLCache(maxsize=shard_maxsize, ttl=cache_ttl), threading.Lock())
+            for _ in range(cache_shards)
+        ]
         self._engine = None
         self._Session = None
         self._scoped_session = None
+        self._async_engine = None
+        self._AsyncSession = None
 
     def init_engine(self) -> None:
         """Initialize database engine with connection pool."""
+        engine_kwargs: Dict[str, Any] = {}
+        url = make_url(self.db_url)
+        if url.get_backend_name() == "postgresql" and url.get_driver_name() == "psycopg2":
+            # Batch executemany() into multi-row VALUES statements
+            engine_kwargs["executemany_mode"] = "values_plus_batch"
+            engine_kwargs["insertmanyvalues_page_size"] = 1000
+
         self._engine = create_engine(
             self.db_url,
             pool_size=self.pool_size,
             max_overflow=self.max_overflow,
-            pool_pre_ping=True
+            pool_pre_ping=True,
+            **engine_kwargs
         )
         self._Session = sessionmaker(bind=self._engine)
         self._scoped_session = scoped_session(self._Session)
 
+    def init_async_engine(self) -> None:
+        """Initialize the async database engine and session factory."""
+        url = self.async_db_url
+        if url is None:
+            parsed = make_url(self.db_url)
+            if parsed.get_backend_name() != "postgresql":
+                raise DatabaseError("async_db_url is required for non-PostgreSQL databases")
+            url = parsed.set(drivername="postgresql+asyncpg")
+
+        self._async_engine = create_async_engine(
+            url,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_pre_ping=True
+        )
+        self._AsyncSession = async_sessionmaker(self._async_engine, expire_on_commit=False)
+
     @property
     def engine(self) -> Any:
         """Get the database engine."""
@@ -99,15 +146,44 @@ class DatabaseTools(Generic[T]):
 
     @property
     def scoped_session(self) -> Any:
-        """Get the scoped session."""
+        """Get the thread-local scoped session (legacy sync call sites only)."""
         if self._scoped_session is None:
             self.init_engine()
         return self._scoped_session
 
+    @property
+    def AsyncSession(self) -> Any:
+        """Get the async session factory."""
+        if self._AsyncSession is None:
+            self.init_async_engine()
+        return self._AsyncSession
+
+    def _shard(self, key: Any) -> Tuple[TTLCache, threading.Lock]:
+        """Get the cache shard and lock responsible for a key."""
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _cache_get(self, key: Any, default: Any = None) -> Any:
+        """Look up a cached value."""
+        cache, lock = self._shard(key)
+        with lock:
+            return cache.get(key, default)
+
+    def _cache_set(self, key: Any, value: Any) -> None:
+        """Store a value in the cache."""
+        cache, lock = self._shard(key)
+        with lock:
+            cache[key] = value
+
+    def clear_cache(self) -> None:
+        """Drop all cached query results."""
+        for cache, lock in self._shards:
+            with lock:
+                cache.clear()
+
     @contextmanager
     def session_scope(self) -> Session:
         """Provide a transactional scope around a series of operations."""
-        session = self.scoped_session()
+        session = self.Session()
         try:
             yield session
             session.commit()
@@ -117,6 +193,16 @@ class DatabaseTools(Generic[T]):
         finally:
             session.close()
 
+    @asynccontextmanager
+    async def async_session_scope(self) -> AsyncIterator[AsyncSession]:
+        """Provide an async transactional scope around a series of operations."""
+        async with self.AsyncSession() as session:
+            try:
+                async with session.begin():
+                    yield session
+            except Exception as e:
+                raise DatabaseError(f"Database transaction failed: {str(e)}", e)
+
     def cache_query_result(
         self,
         query: Select,
@@ -133,13 +219,15 @@ class DatabaseTools(Generic[T]):
         Returns:
             Any: Query result
         """
-        if not force_refresh and cache_key in self.cache:
-            logger.debug(f"Cache hit for query: {cache_key}")
-            return self.cache[cache_key]
+        if not force_refresh:
+            cached = self._cache_get(cache_key, _MISS)
+            if cached is not _MISS:
+                logger.debug(f"Cache hit for query: {cache_key}")
+                return cached
 
         with self.session_scope() as session:
             result = session.execute(query).scalars().all()
-            self.cache[cache_key] = result
+            self._cache_set(cache_key, result)
             return result
 
     def paginate_query(
@@ -164,25 +252,41 @@ class DatabaseTools(Generic[T]):
             raise ValueError("Page number must be greater than 0")
 
         offset = (page - 1) * per_page
-        paginated_query = query.offset(offset).limit(per_page)
 
         with self.session_scope() as session:
-            items = session.execute(paginated_query).scalars().all()
-            
             result = {
-                "items": items,
+                "items": [],
                 "page": page,
                 "per_page": per_page,
                 "total_pages": None,
                 "total_items": None
             }
 
-            if total_count:
+            if not total_count:
+                paginated_query = query.offset(offset).limit(per_page)
+                result["items"] = session.execute(paginated_query).scalars().all()
+                return result
+
+            # Fetch the page and the total in one round-trip via COUNT(*) OVER ()
+            paginated_query = (
+                query.add_columns(func.count().over().label("_total"))
+                .offset(offset)
+                .limit(per_page)
+            )
+            rows = session.execute(paginated_query).all()
+            result["items"] = [row[0] for row in rows]
+
+            if rows:
+                total_items = rows[0]._total
+            elif offset:
+                # Page past the end: no row carries the window count
                 count_query = select(func.count()).select_from(query.subquery())
                 total_items = session.execute(count_query).scalar()
-                result["total_items"] = total_items
-                result["total_pages"] = (total_items + per_page - 1) // per_page
+            else:
+                total_items = 0
 
+            result["total_items"] = total_items
+            result["total_pages"] = (total_items + per_page - 1) // per_page
             return result
 
     def execute_raw_sql(
@@ -218,7 +322,7 @@ class DatabaseTools(Generic[T]):
             return
 
         with self.session_scope() as session:
-            session.bulk_insert_mappings(model, data)
+            session.execute(insert(model), data)
 
     def bulk_update(
         self,
@@ -228,6 +332,9 @@ class DatabaseTools(Generic[T]):
     ) -> None:
         """Bulk update multiple records.
 
+        Each dictionary must contain the model's primary key, which is used
+        to match rows.
+
         Args:
             model: SQLAlchemy model class
             data: List of dictionaries containing data
@@ -236,12 +343,12 @@ class DatabaseTools(Generic[T]):
         if not data:
             return
 
+        keep = set(update_fields)
+        keep.update(column.key for column in inspect(model).primary_key)
+        rows = [{k: v for k, v in item.items() if k in keep} for item in data]
+
         with self.session_scope() as session:
-            session.bulk_update_mappings(
-                model,
-                [{k: v for k, v in item.items() if k in update_fields}
-                 for item in data]
-            )
+            session.execute(update(model), rows)
 
     def upsert(
         self,
@@ -280,20 +387,64 @@ class DatabaseTools(Generic[T]):
             defaults: Default values for new record
             **kwargs: Filter criteria
 
+        On PostgreSQL, when the filter criteria are exactly the columns of a
+        unique constraint, the record is created and returned by a single
+        ``INSERT ... ON CONFLICT (...) DO NOTHING RETURNING`` statement, which
+        also avoids duplicate inserts from concurrent callers; the record is
+        only SELECTed when it already exists. Other lookups SELECT first and
+        insert if nothing is found.
+
         Returns:
             tuple: (record, created)
         """
+        params = {**(defaults or {}), **kwargs}
+
         with self.session_scope() as session:
+            conflict_target = None
+            if session.get_bind().dialect.name == "postgresql":
+                conflict_target = self._unique_columns(model, kwargs)
+
+            if conflict_target:
+                stmt = (
+                    pg_insert(model)
+                    .values(**params)
+                    .on_conflict_do_nothing(index_elements=conflict_target)
+                    .returning(model)
+                )
+                instance = session.scalars(stmt).first()
+                if instance is not None:
+                    return instance, True
+                # The key already exists, possibly inserted by a concurrent caller
+                return session.query(model).filter_by(**kwargs).one(), False
+
             instance = session.query(model).filter_by(**kwargs).first()
             if instance:
                 return instance, False
-            
-            params = defaults or {}
-            params.update(kwargs)
+
             instance = model(**params)
             session.add(instance)
             return instance, True
 
+    @staticmethod
+    def _unique_columns(model: Type[T], keys: Iterable[str]) -> Optional[List[str]]:
+        """Column names of the unique constraint matching ``keys``, if any."""
+        mapper = inspect(model)
+        try:
+            names = {mapper.columns[key].name for key in keys}
+        except KeyError:
+            return None
+
+        table = mapper.local_table
+        candidates = [
+            constraint.columns for constraint in table.constraints
+            if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint))
+        ]
+        candidates.extend(index.columns for index in table.indexes if index.unique)
+        for columns in candidates:
+            if names and {column.name for column in columns} == names:
+                return sorted(names)
+        return None
+
     def transactional(
         self,
         func: Callable
@@ -23,24 +23,94 @@ Features:
 - Async operations
 """
 
+import asyncio
+import errno
+import fnmatch
 import logging
 import os
+import re
 import shutil
+import sys
 import tempfile
+import threading
 import zipfile
 import tarfile
 import gzip
 import json
 import csv
 import yaml
-from typing import Any, Dict, List, Optional, Union, AsyncGenerator, Generator
+from typing import Any, Dict, Iterable, List, Optional, Union, AsyncGenerator, Generator
 from pathlib import Path
-import aiofiles
+from collections import deque
+from cachetools import TTLCache
 from contextlib import contextmanager
 from functools import wraps
 
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+try:
+    import orjson
+except ImportError:  # orjson wheels are not available on every platform
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    from scandir_rs import Count, ReturnType, Walk
+except ImportError:
+    Count = ReturnType = Walk = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 logger = logging.getLogger(__name__)
 
+_CSV_ERRORS = (IOError, csv.Error, ValueError) + ((pl.exceptions.PolarsError,) if pl else ())
+
+COPY_BUFFER_SIZE = 1 << 20  # 1 MiB
+# Below this size simdjson's per-call overhead outweighs its parsing speed
+SIMDJSON_MIN_BYTES = int(os.environ.get('FILETOOLS_SIMD_MIN_BYTES', 64 * 1024))
+# Upper bound, in seconds, on how stale a cached path or stat result can be
+CACHE_TTL_SECONDS = float(os.environ.get('FILETOOLS_CACHE_TTL', 1.0))
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# copy_file_range() errors that mean "not supported here", not "copy failed"
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF
+})
+
+# simdjson parsers own a reusable buffer but are not thread-safe, and each
+# parse() invalidates the previous document: keep one parser per thread.
+_simd_local = threading.local()
+
+def _get_simd_parser() -> Optional["simdjson.Parser"]:
+    """Get this thread's reusable simdjson parser, or None if unavailable."""
+    if simdjson is None:
+        return None
+    parser = getattr(_simd_local, 'parser', None)
+    if parser is None:
+        parser = _simd_local.parser = simdjson.Parser()
+    return parser
+
 class FileError(Exception):
     """Custom exception for file-related errors."""
     def __init__(self, message: str, original_error: Optional[Exception] = None):
@@ -51,16 +121,95 @@ class FileError(Exception):
 class FileTools:
     """Class containing various file utility functions."""
 
-    def __init__(self, base_dir: str = None):
+    def __init__(
+        self,
+        base_dir: str = None,
+        cache_maxsize: int = 4096,
+        cache_ttl: float = CACHE_TTL_SECONDS
+    ):
         """Initialize file tools with optional base directory.
 
+        Resolved paths and stat results are cached per instance, keyed by
+        absolute path, so a file that is validated, sized and then read within
+        one workflow is only stat'ed once. Operations on this instance that
+        write, move or delete a path invalidate its entries (and everything
+        below it for directory operations). Changes made by other means,
+        including other FileTools instances, are seen once the entries expire
+        after ``cache_ttl`` seconds, or immediately after invalidate_cache().
+
         Args:
             base_dir (str, optional): Base directory for file operations
+            cache_maxsize (int): Maximum number of cached paths and stat results
+            cache_ttl (float): Seconds a cached entry stays valid; 0 disables caching
         """
         self.base_dir = Path(base_dir) if base_dir else Path.cwd()
+        self._resolved_cache: TTLCache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        self._stat_cache: TTLCache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
 
     @staticmethod
-    def validate_path(path: Union[str, Path]) -> Path:
+    def _cache_key(path: Union[str, Path]) -> str:
+        """Normalize a path so ``a``, ``./a`` and its absolute form share entries."""
+        return os.path.abspath(path)
+
+    def _stat(self, path: Union[str, Path]) -> os.stat_result:
+        """Stat a path, reusing a cached result when available."""
+        key = self._cache_key(path)
+        st = self._stat_cache.get(key)
+        if st is None:
+            st = os.stat(key)
+            self._stat_cache[key] = st
+        return st
+
+    def invalidate_cache(self, *paths: Union[str, Path]) -> None:
+        """Drop cached path and stat data.
+
+        Args:
+            *paths (str or Path): Paths to forget; clears everything when omitted
+        """
+        if not paths:
+            self._resolved_cache.clear()
+            self._stat_cache.clear()
+            return
+        for path in paths:
+            key = self._cache_key(path)
+            self._resolved_cache.pop(key, None)
+            self._stat_cache.pop(key, None)
+
+    def _invalidate_tree(self, path: Union[str, Path]) -> None:
+        """Drop cached data for a path and everything below it."""
+        key = self._cache_key(path)
+        prefix = os.path.join(key, '')
+        for cache in (self._resolved_cache, self._stat_cache):
+            cache.pop(key, None)
+            for stale in [k for k in cache if k.startswith(prefix)]:
+                del cache[stale]
+
+    @staticmethod
+    def _iter_scandir(root: Union[str, Path], recursive: bool = True) -> Generator[os.DirEntry, None, None]:
+        """Iterate over the non-directory entries below a directory.
+
+        Uses an explicit stack and os.scandir so file type and stat data come
+        from the cached directory entry instead of extra stat() calls.
+        Symlinked directories are not followed.
+
+        Args:
+            root (str or Path): Directory to walk
+            recursive (bool): Whether to descend into subdirectories
+
+        Yields:
+            os.DirEntry: File (or symlink) entries
+        """
+        stack = deque([os.fspath(root)])
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    else:
+                        yield entry
+
+    def validate_path(self, path: Union[str, Path]) -> Path:
         """Validate and normalize a file path.
 
         Args:
@@ -74,15 +223,22 @@ class FileTools:
         """
         if not path:
             raise ValueError("Path cannot be empty")
-        
-        path = Path(path)
-        if not path.exists():
+
+        key = self._cache_key(path)
+        resolved = self._resolved_cache.get(key)
+        if resolved is not None:
+            return resolved
+
+        try:
+            self._stat(key)
+        except OSError:
             raise ValueError(f"Path does not exist: {path}")
-        
-        return path.resolve()
 
-    @staticmethod
-    def get_file_size(path: Union[str, Path]) -> int:
+        resolved = Path(key).resolve()
+        self._resolved_cache[key] = resolved
+        return resolved
+
+    def get_file_size(self, path: Union[str, Path]) -> int:
         """Get the size of a file in bytes.
 
         Args:
@@ -95,16 +251,18 @@ class FileTools:
             FileError: If file cannot be accessed
         """
         try:
-            return os.path.getsize(str(path))
+            return self._stat(path).st_size
         except OSError as e:
             raise FileError(f"Error getting file size: {e}", e)
 
     @staticmethod
-    def get_directory_size(path: Union[str, Path]) -> int:
+    def get_directory_size(path: Union[str, Path], parallel: bool = False) -> int:
         """Get the total size of a directory in bytes.
 
         Args:
             path (str or Path): Directory path
+            parallel (bool): Use the multi-threaded scandir-rs walker when it is
+                installed; useful on network filesystems
 
         Returns:
             int: Directory size in bytes
@@ -113,37 +271,80 @@ class FileTools:
             FileError: If directory cannot be accessed
         """
         try:
-            total_size = 0
-            for dirpath, dirnames, filenames in os.walk(str(path)):
-                for f in filenames:
-                    fp = os.path.join(dirpath, f)
-                    if not os.path.islink(fp):
-                        total_size += os.path.getsize(fp)
-            return total_size
+            if parallel and Count is not None:
+                return Count(str(path), return_type=ReturnType.Ext).collect().size
+            return sum(
+                entry.stat(follow_symlinks=False).st_size
+                for entry in FileTools._iter_scandir(path)
+                if not entry.is_symlink()
+            )
         except OSError as e:
             raise FileError(f"Error getting directory size: {e}", e)
 
     @staticmethod
-    def read_json_file(path: Union[str, Path]) -> Dict:
+    def _simdjson_export(value: Any) -> Any:
+        """Materialize a lazy simdjson value as plain Python objects."""
+        if isinstance(value, simdjson.Object):
+            return value.as_dict()
+        if isinstance(value, simdjson.Array):
+            return value.as_list()
+        return value
+
+    @staticmethod
+    def read_json_file(
+        path: Union[str, Path],
+        keys: Optional[Iterable[str]] = None
+    ) -> Dict:
         """Read and parse a JSON file.
 
+        When ``keys`` is given, simdjson is installed and the file is at least
+        FILETOOLS_SIMD_MIN_BYTES (default 64 KiB), the document is parsed lazily and only the requested top-level keys are converted to
+        Python objects, which is much cheaper than building the whole dict.
+        The result is a plain copy; it is not a view on the file.
+
         Args:
             path (str or Path): JSON file path
+            keys (iterable, optional): Top-level keys to return; missing keys are skipped
 
         Returns:
             dict: Parsed JSON data
 
         Raises:
-            FileError: If file cannot be read or parsed
+            FileError: If file cannot be read or parsed, or if keys are given
+                and the document is not a JSON object
         """
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (IOError, json.JSONDecodeError) as e:
+            with open(path, 'rb') as f:
+                raw = f.read()
+
+            # simdjson's setup cost only pays off on larger documents
+            if keys is not None and simdjson is not None and len(raw) >= SIMDJSON_MIN_BYTES:
+                doc = _get_simd_parser().parse(raw)
+                try:
+                    if not isinstance(doc, simdjson.Object):
+                        raise FileError(f"Cannot select keys from a non-object JSON document: {path}")
+                    result = {}
+                    for key in keys:
+                        try:
+                            result[key] = FileTools._simdjson_export(doc[key])
+                        except KeyError:
+                            continue
+                    return result
+                finally:
+                    # A live document (e.g. held by a traceback) blocks reuse
+                    # of this thread's parser
+                    del doc
+
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if keys is not None:
+                if not isinstance(data, dict):
+                    raise FileError(f"Cannot select keys from a non-object JSON document: {path}")
+                return {key: data[key] for key in keys if key in data}
+            return data
+        except (IOError, ValueError, TypeError, RuntimeError) as e:
             raise FileError(f"Error reading JSON file: {e}", e)
 
-    @staticmethod
-    def write_json_file(data: Dict, path: Union[str, Path], indent: int = 2) -> None:
+    def write_json_file(self, data: Dict, path: Union[str, Path], indent: int = 2) -> None:
         """Write data to a JSON file.
 
         Args:
@@ -155,10 +356,20 @@ class FileTools:
             FileError: If file cannot be written
         """
         try:
+            # orjson only supports two-space indentation
+            if orjson is not None and indent in (None, 0, 2):
+                option = orjson.OPT_NON_STR_KEYS
+                if indent:
+                    option |= orjson.OPT_INDENT_2
+                with open(path, 'wb') as f:
+                    f.write(orjson.dumps(data, option=option))
+                return
             with open(path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=indent, ensure_ascii=False)
         except IOError as e:
             raise FileError(f"Error writing JSON file: {e}", e)
+        finally:
+            self.invalidate_cache(path)
 
     @staticmethod
     def read_yaml_file(path: Union[str, Path]) -> Dict:
@@ -175,12 +386,11 @@ class FileTools:
         """
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=_YamlLoader)
         except (IOError, yaml.YAMLError) as e:
             raise FileError(f"Error reading YAML file: {e}", e)
 
-    @staticmethod
-    def write_yaml_file(data: Dict, path: Union[str, Path]) -> None:
+    def write_yaml_file(self, data: Dict, path: Union[str, Path]) -> None:
         """Write data to a YAML file.
 
         Args:
@@ -192,51 +402,99 @@ class FileTools:
         """
         try:
             with open(path, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False)
+                yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False)
         except IOError as e:
             raise FileError(f"Error writing YAML file: {e}", e)
+        finally:
+            self.invalidate_cache(path)
 
     @staticmethod
-    def read_csv_file(path: Union[str, Path]) -> List[Dict]:
+    def read_csv_file(
+        path: Union[str, Path],
+        engine: str = 'stdlib',
+        as_dicts: bool = True
+    ) -> Any:
         """Read and parse a CSV file.
 
+        The 'arrow' and 'polars' engines parse in native code and are much
+        faster on large files, but infer column types instead of returning
+        strings; for small files the stdlib reader is usually quicker.
+
         Args:
             path (str or Path): CSV file path
+            engine (str): 'stdlib', 'arrow' or 'polars'
+            as_dicts (bool): Convert arrow/polars results to a list of dicts;
+                when False the pyarrow Table / polars DataFrame is returned
 
         Returns:
-            list: List of dictionaries (one per row)
+            list: List of dictionaries (one per row), or a table when as_dicts is False
 
         Raises:
             FileError: If file cannot be read or parsed
         """
         try:
+            if engine == 'arrow':
+                if pacsv is None:
+                    raise FileError("pyarrow is required for engine='arrow'")
+                table = pacsv.read_csv(str(path))
+                return table.to_pylist() if as_dicts else table
+            if engine == 'polars':
+                if pl is None:
+                    raise FileError("polars is required for engine='polars'")
+                frame = pl.read_csv(str(path))
+                return frame.to_dicts() if as_dicts else frame
+            if engine != 'stdlib':
+                raise ValueError(f"Unknown CSV engine: {engine}")
+
             with open(path, 'r', encoding='utf-8') as f:
                 return list(csv.DictReader(f))
-        except (IOError, csv.Error) as e:
+        except _CSV_ERRORS as e:
             raise FileError(f"Error reading CSV file: {e}", e)
 
-    @staticmethod
-    def write_csv_file(data: List[Dict], path: Union[str, Path]) -> None:
+    def write_csv_file(
+        self,
+        data: Iterable[Dict],
+        path: Union[str, Path],
+        engine: str = 'stdlib'
+    ) -> None:
         """Write data to a CSV file.
 
+        ``data`` may be any iterable, including a generator; rows are
+        streamed to disk without building a list. Columns are taken from the
+        first row and keys missing from it are ignored in later rows.
+
         Args:
-            data (list): List of dictionaries to write
+            data (iterable): Dictionaries to write
             path (str or Path): Output file path
+            engine (str): 'stdlib' or 'arrow'
 
         Raises:
             FileError: If file cannot be written
         """
         try:
-            if not data:
+            rows = iter(data)
+            try:
+                first = next(rows)
+            except StopIteration:
+                return
+
+            if engine == 'arrow':
+                if pacsv is None:
+                    raise FileError("pyarrow is required for engine='arrow'")
+                pacsv.write_csv(pa.Table.from_pylist([first, *rows]), str(path))
                 return
+            if engine != 'stdlib':
+                raise ValueError(f"Unknown CSV engine: {engine}")
 
-            fieldnames = data[0].keys()
-            with open(path, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
+            with open(path, 'w', encoding='utf-8', newline='', buffering=COPY_BUFFER_SIZE) as f:
+                writer = csv.DictWriter(f, fieldnames=list(first), extrasaction='ignore')
                 writer.writeheader()
-                writer.writerows(data)
-        except (IOError, csv.Error) as e:
+                writer.writerow(first)
+                writer.writerows(rows)
+        except _CSV_ERRORS as e:
             raise FileError(f"Error writing CSV file: {e}", e)
+        finally:
+            self.invalidate_cache(path)
 
     @staticmethod
     def create_temp_file(suffix: str = None) -> Path:
@@ -259,34 +517,53 @@ class FileTools:
         """
         return Path(tempfile.mkdtemp())
 
-    @staticmethod
     def zip_directory(
+        self,
         source_dir: Union[str, Path],
         output_path: Union[str, Path],
-        compression: int = zipfile.ZIP_DEFLATED
+        compression: int = zipfile.ZIP_DEFLATED,
+        compresslevel: Optional[int] = None
     ) -> None:
         """Compress a directory to a ZIP file.
 
+        Files are streamed into the archive in COPY_BUFFER_SIZE chunks rather
+        than read into memory; entries carry the time the archive was written,
+        not the files' mtimes. Deflate defaults to level 1, which is much
+        faster and good enough for scratch archives.
+
         Args:
             source_dir (str or Path): Directory to compress
             output_path (str or Path): Output ZIP file path
-            compression (int): Compression level
+            compression (int): Compression method (zipfile.ZIP_ZSTANDARD on
+                Python 3.14+ is much faster than deflate)
+            compresslevel (int, optional): Compression level
 
         Raises:
             FileError: If compression fails
         """
+        if compresslevel is None and compression == zipfile.ZIP_DEFLATED:
+            compresslevel = 1
+
         try:
-            with zipfile.ZipFile(output_path, 'w', compression=compression) as zipf:
-                for root, _, files in os.walk(source_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, source_dir)
-                        zipf.write(file_path, arcname)
+            with zipfile.ZipFile(
+                output_path, 'w', compression=compression, compresslevel=compresslevel
+            ) as zipf:
+                for entry in FileTools._iter_scandir(source_dir):
+                    if not entry.is_file():
+                        continue
+                    arcname = os.path.relpath(entry.path, source_dir)
+                    # Opening by name applies the archive's compression and
+                    # compresslevel; zip64 because the size is not known upfront
+                    with open(entry.path, 'rb') as src:
+                        with zipf.open(arcname, 'w', force_zip64=True) as dst:
+                            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
         except Exception as e:
             raise FileError(f"Error creating ZIP file: {e}", e)
+        finally:
+            self.invalidate_cache(output_path)
 
-    @staticmethod
     def unzip_file(
+        self,
         zip_path: Union[str, Path],
         output_dir: Union[str, Path]
     ) -> None:
@@ -304,9 +581,11 @@ class FileTools:
                 zipf.extractall(output_dir)
         except Exception as e:
             raise FileError(f"Error extracting ZIP file: {e}", e)
+        finally:
+            self._invalidate_tree(output_dir)
 
-    @staticmethod
     def create_tarball(
+        self,
         source_dir: Union[str, Path],
         output_path: Union[str, Path],
         compression: str = 'gz'
@@ -316,41 +595,68 @@ class FileTools:
         Args:
             source_dir (str or Path): Directory to compress
             output_path (str or Path): Output tarball path
-            compression (str): Compression type ('gz', 'bz2', 'xz')
+            compression (str): Compression type ('gz', 'bz2', 'xz', or 'zstd',
+                which compresses on all cores and requires the zstandard package)
 
         Raises:
             FileError: If tarball creation fails
         """
         try:
+            if compression == 'zstd':
+                if zstandard is None:
+                    raise FileError("zstandard is required for zstd compression")
+                compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+                with open(output_path, 'wb') as raw, \
+                        compressor.stream_writer(raw) as writer, \
+                        tarfile.open(fileobj=writer, mode='w|') as tar:
+                    tar.add(source_dir, arcname=os.path.basename(source_dir))
+                return
+
             with tarfile.open(output_path, f'w:{compression}') as tar:
                 tar.add(source_dir, arcname=os.path.basename(source_dir))
         except Exception as e:
             raise FileError(f"Error creating tarball: {e}", e)
+        finally:
+            self.invalidate_cache(output_path)
 
-    @staticmethod
     def extract_tarball(
+        self,
         tar_path: Union[str, Path],
         output_dir: Union[str, Path]
     ) -> None:
         """Extract a tarball to a directory.
 
         Args:
-            tar_path (str or Path): Tarball path
+            tar_path (str or Path): Tarball path (.zst/.zstd tarballs need zstandard)
             output_dir (str or Path): Output directory
 
         Raises:
             FileError: If extraction fails
         """
         try:
+            if str(tar_path).endswith(('.zst', '.zstd')):
+                if zstandard is None:
+                    raise FileError("zstandard is required for zstd tarballs")
+                with open(tar_path, 'rb') as raw, \
+                        zstandard.ZstdDecompressor().stream_reader(raw) as reader, \
+                        tarfile.open(fileobj=reader, mode='r|') as tar:
+                    tar.extractall(output_dir)
+                return
+
             with tarfile.open(tar_path, 'r:*') as tar:
                 tar.extractall(output_dir)
         except Exception as e:
             raise FileError(f"Error extracting tarball: {e}", e)
+        finally:
+            self._invalidate_tree(output_dir)
 
     @staticmethod
     async def async_read_file(path: Union[str, Path]) -> str:
         """Asynchronously read a file.
 
+        The blocking read runs in the default thread pool, which is faster
+        than aiofiles for one-shot reads.
+
         Args:
             path (str or Path): File path
 
@@ -361,13 +667,27 @@ class FileTools:
             FileError: If file cannot be read
         """
         try:
-            async with aiofiles.open(path, mode='r', encoding='utf-8') as f:
-                return await f.read()
+            return await asyncio.to_thread(Path(path).read_text, encoding='utf-8')
         except Exception as e:
             raise FileError(f"Error reading file asynchronously: {e}", e)
 
     @staticmethod
+    async def async_read_files(paths: List[Union[str, Path]]) -> List[str]:
+        """Asynchronously read several files concurrently.
+
+        Args:
+            paths (list): File paths
+
+        Returns:
+            list: File contents, in the same order as ``paths``
+
+        Raises:
+            FileError: If any file cannot be read
+        """
+        return await asyncio.gather(*(FileTools.async_read_file(path) for path in paths))
+
     async def async_write_file(
+        self,
         content: str,
         path: Union[str, Path]
     ) -> None:
@@ -381,13 +701,14 @@ class FileTools:
             FileError: If file cannot be written
         """
         try:
-            async with aiofiles.open(path, mode='w', encoding='utf-8') as f:
-                await f.write(content)
+            await asyncio.to_thread(Path(path).write_text, content, encoding='utf-8')
         except Exception as e:
             raise FileError(f"Error writing file asynchronously: {e}", e)
+        finally:
+            self.invalidate_cache(path)
 
-    @staticmethod
     def atomic_write_file(
+        self,
         content: str,
         path: Union[str, Path]
     ) -> None:
@@ -405,11 +726,40 @@ class FileTools:
             with open(temp_path, 'w', encoding='utf-8') as f:
                 f.write(content)
             os.replace(temp_path, path)
+            self.invalidate_cache(path)
         except Exception as e:
             raise FileError(f"Error writing file atomically: {e}", e)
 
     @staticmethod
+    def _copy_file_range(src: Union[str, Path], dst: Union[str, Path]) -> bool:
+        """Copy file data entirely in the kernel with copy_file_range(2).
+
+        Args:
+            src (str or Path): Source file path
+            dst (str or Path): Destination file path
+
+        Returns:
+            bool: False if the platform or filesystem does not support it
+        """
+        if sys.platform != 'linux' or not hasattr(os, 'copy_file_range'):
+            return False
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+        except OSError as e:
+            if e.errno in _COPY_FILE_RANGE_UNSUPPORTED:
+                return False
+            raise
+        shutil.copystat(src, dst)
+        return True
+
     def copy_file(
+        self,
         src: Union[str, Path],
         dst: Union[str, Path],
         overwrite: bool = True
@@ -425,14 +775,21 @@ class FileTools:
             FileError: If copy fails
         """
         try:
+            if os.path.isdir(dst):
+                dst = os.path.join(dst, os.path.basename(src))
             if not overwrite and os.path.exists(dst):
                 raise FileError(f"Destination file already exists: {dst}")
-            shutil.copy2(src, dst)
+            # Opening dst for writing would truncate src if they are the same file
+            if os.path.exists(dst) and os.path.samefile(src, dst):
+                raise FileError(f"Source and destination are the same file: {src}")
+            if not self._copy_file_range(src, dst):
+                shutil.copy2(src, dst)
+            self.invalidate_cache(dst)
         except Exception as e:
             raise FileError(f"Error copying file: {e}", e)
 
-    @staticmethod
     def move_file(
+        self,
         src: Union[str, Path],
         dst: Union[str, Path],
         overwrite: bool = True
@@ -451,11 +808,12 @@ class FileTools:
             if not overwrite and os.path.exists(dst):
                 raise FileError(f"Destination file already exists: {dst}")
             shutil.move(src, dst)
+            self._invalidate_tree(src)
+            self._invalidate_tree(dst)
         except Exception as e:
             raise FileError(f"Error moving file: {e}", e)
 
-    @staticmethod
-    def delete_file(path: Union[str, Path]) -> None:
+    def delete_file(self, path: Union[str, Path]) -> None:
         """Delete a file.
 
         Args:
@@ -466,11 +824,11 @@ class FileTools:
         """
         try:
             os.remove(path)
+            self.invalidate_cache(path)
         except Exception as e:
             raise FileError(f"Error deleting file: {e}", e)
 
-    @staticmethod
-    def delete_directory(path: Union[str, Path], recursive: bool = True) -> None:
+    def delete_directory(self, path: Union[str, Path], recursive: bool = True) -> None:
         """Delete a directory.
 
         Args:
@@ -487,12 +845,15 @@ class FileTools:
                 os.rmdir(path)
         except Exception as e:
             raise FileError(f"Error deleting directory: {e}", e)
+        finally:
+            self._invalidate_tree(path)
 
     @staticmethod
     def list_files(
         directory: Union[str, Path],
         recursive: bool = False,
-        pattern: str = None
+        pattern: str = None,
+        parallel: bool = False
     ) -> List[Path]:
         """List files in a directory.
 
@@ -500,16 +861,28 @@ class FileTools:
             directory (str or Path): Directory path
             recursive (bool): Whether to search recursively
             pattern (str): File pattern to match
+            parallel (bool): For recursive listings, use the multi-threaded
+                scandir-rs walker when it is installed
 
         Returns:
             list: List of file paths
         """
-        path = Path(directory)
-        if recursive:
-            files = list(path.rglob(pattern or '*'))
-        else:
-            files = list(path.glob(pattern or '*'))
-        return [f for f in files if f.is_file()]
+        if parallel and recursive and Walk is not None:
+            files = []
+            for root, _, filenames in Walk(str(directory)):
+                if pattern:
+                    filenames = fnmatch.filter(filenames, pattern)
+                root_path = Path(directory, root)
+                files.extend(root_path / name for name in filenames)
+            return files
+
+        match = re.compile(fnmatch.translate(pattern)).match if pattern else None
+        return [
+            Path(entry.path)
+            for entry in FileTools._iter_scandir(directory, recursive)
+            if entry.is_file(follow_symlinks=False)
+            and (match is None or match(entry.name))
+        ]
 
     @staticmethod
     def get_file_extension(path: Union[str, Path]) -> str:
@@ -545,11 +918,11 @@ class FileTools:
         Returns:
             str: Human-readable size (e.g., "1.5 MB")
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024
-        return f"{size_bytes:.1f} PB"
+        if size_bytes < 1024:
+            return f"{size_bytes:.1f} B"
+        # Each unit is 2**10 of the previous one, so the bit length picks it
+        index = min((int(size_bytes).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (index * 10)):.1f} {SIZE_UNITS[index]}"
 
 # Example usage:
 if __name__ == "__main__":
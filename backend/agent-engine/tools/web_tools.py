@@ -24,22 +24,103 @@ Features:
 - Error handling and logging
 """
 
+import asyncio
+import hashlib
 import logging
+import os
+import pickle
 import re
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union, AsyncGenerator, Generator
-from urllib.parse import urlparse, urljoin, urlsplit
-from functools import wraps
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Union, AsyncGenerator, Generator
+from urllib.parse import SplitResult, urljoin, urlsplit, urlunsplit
+from functools import lru_cache, wraps
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-from aiohttp import ClientSession
-from cachetools import TTLCache
-from tenacity import retry, stop_after_attempt, wait_exponential
+from aiohttp import ClientError, ClientResponseError, ClientSession, ClientTimeout, TCPConnector
+import orjson
+
+try:
+    import lxml  # noqa: F401
+    _HAS_LXML = True
+except ImportError:
+    _HAS_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as _FastHTML
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as _FastHTML
+    except ImportError:
+        _FastHTML = None
+try:
+    from cachebox import TTLCache
+except ImportError:
+    from cachetools import TTLCache
+from tenacity import (
+    AsyncRetrying,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential
+)
 
 logger = logging.getLogger(__name__)
 
+def _orjson_dumps(obj: Any) -> str:
+    """Serialize request bodies with orjson (aiohttp expects a str)."""
+    return orjson.dumps(obj).decode()
+
+@lru_cache(maxsize=4096)
+def _cached_split(url: str) -> SplitResult:
+    """Split a URL, memoizing the result for repeated URLs."""
+    return urlsplit(url)
+
+# Below this size html.parser beats lxml, whose setup cost dominates small pages
+LXML_MIN_BYTES = int(os.environ.get('WEBTOOLS_LXML_MIN_BYTES', 64 * 1024))
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+def _is_retryable(error: BaseException) -> bool:
+    """Whether an aiohttp failure is worth retrying (transient, not 4xx)."""
+    if isinstance(error, ClientResponseError):
+        return error.status in RETRY_STATUS_CODES
+    return isinstance(error, (ClientError, asyncio.TimeoutError))
+
+# Raw-text elements whose content can be cut out of the markup before parsing
+_RAW_TEXT_TAGS = frozenset({'script', 'style', 'noscript'})
+
+@lru_cache(maxsize=None)
+def _raw_text_tag_re(tags: frozenset, binary: bool) -> "re.Pattern":
+    """Compile a regex matching whole <tag>...</tag> blocks for the given tags."""
+    pattern = r'<(%s)\b[^>]*>.*?</\1\s*>' % '|'.join(sorted(tags))
+    if binary:
+        pattern = pattern.encode()
+    return re.compile(pattern, re.IGNORECASE | re.DOTALL)
+
+def _request_cache_key(name: str, args: tuple, kwargs: Dict) -> Any:
+    """Build a compact, hashable cache key for a request or function call.
+
+    Same scheme as APITools._make_cache_key: hashable arguments are used
+    directly as a tuple; otherwise the call is pickled and reduced to a
+    16-byte blake2b digest. Both keep argument types apart, so ``(1, 2)``
+    and ``[1, 2]`` or ``Decimal('1')`` and ``'1'`` never share an entry.
+    """
+    key = (name, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+        return key
+    except TypeError:
+        pass
+    try:
+        payload = pickle.dumps((name, args, kwargs), protocol=5)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        payload = repr((name, args, kwargs)).encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
 class WebError(Exception):
     """Custom exception for web-related errors."""
     def __init__(self, message: str, original_error: Optional[Exception] = None):
@@ -67,11 +148,15 @@ class WebTools:
             timeout (int): Request timeout in seconds
             user_agent (str): User agent string
         """
-        self.cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        # Positional args: cachebox and cachetools name the TTL argument differently
+        self.cache = TTLCache(cache_maxsize, cache_ttl)
         self.max_retries = max_retries
         self.timeout = timeout
         self.user_agent = user_agent
+        # Sessions are bound to the thread/event loop that first used them;
+        # they must not be shared across event loops.
         self._session = None
+        self._aio_session: Optional[ClientSession] = None
 
     def _get_session(self) -> requests.Session:
         """Get or create a requests session with retry configuration.
@@ -83,7 +168,7 @@ class WebTools:
             session = requests.Session()
             retry_strategy = Retry(
                 total=self.max_retries,
-                status_forcelist=[429, 500, 502, 503, 504],
+                status_forcelist=RETRY_STATUS_CODES,
                 backoff_factor=1
             )
             adapter = HTTPAdapter(max_retries=retry_strategy)
@@ -92,6 +177,34 @@ class WebTools:
             self._session = session
         return self._session
 
+    async def _get_aio_session(self) -> ClientSession:
+        """Get or create the shared aiohttp session.
+
+        Returns:
+            ClientSession: Pooled session reused across async requests
+        """
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = ClientSession(
+                connector=TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                timeout=ClientTimeout(total=self.timeout),
+                json_serialize=_orjson_dumps
+            )
+        return self._aio_session
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP sessions."""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+        self._aio_session = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     @staticmethod
     def validate_url(url: str) -> bool:
         """Validate a URL format.
@@ -103,9 +216,9 @@ class WebTools:
             bool: True if URL is valid, False otherwise
         """
         try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except:
+            result = _cached_split(url)
+            return bool(result.scheme and result.netloc)
+        except (TypeError, ValueError):
             return False
 
     @staticmethod
@@ -118,7 +231,7 @@ class WebTools:
         Returns:
             str: Normalized URL
         """
-        parts = urlsplit(url)
+        parts = _cached_split(url)
         return urlunsplit((
             parts.scheme,
             parts.netloc,
@@ -137,8 +250,7 @@ class WebTools:
         Returns:
             str: Domain name
         """
-        parsed = urlparse(url)
-        return parsed.netloc
+        return _cached_split(url).netloc
 
     @retry(
         stop=stop_after_attempt(3),
@@ -166,12 +278,12 @@ class WebTools:
         Raises:
             WebError: If request fails
         """
-        if cache:
-            cache_key = f"get_{url}_{params}_{headers}"
-            if cache_key in self.cache:
-                return self.cache[cache_key]
-
         try:
+            if cache:
+                cache_key = _request_cache_key('get', (url,), {'params': params, 'headers': headers})
+                if cache_key in self.cache:
+                    return self.cache[cache_key]
+
             headers = headers or {}
             headers['User-Agent'] = self.user_agent
             
@@ -218,32 +330,83 @@ class WebTools:
             headers = headers or {}
             headers['User-Agent'] = self.user_agent
             
-            async with ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    headers=headers,
-                    timeout=self.timeout
-                ) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            session = await self._get_aio_session()
+            async with session.get(
+                url,
+                params=params,
+                headers=headers
+            ) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
         except Exception as e:
             raise WebError(f"Async request failed: {e}", e)
 
+    async def async_get_many(
+        self,
+        urls: List[str],
+        concurrency: int = 32,
+        headers: Optional[Dict] = None
+    ) -> List[Any]:
+        """Fetch many URLs concurrently over the shared session.
+
+        Requests are gated by a semaphore; each URL is retried on connection
+        errors, timeouts and 429/5xx responses. JSON responses are decoded, anything else is returned as text.
+
+        Args:
+            urls (list): URLs to request
+            concurrency (int): Maximum number of requests in flight
+            headers (dict, optional): Request headers
+
+        Returns:
+            list: Response data in input order; failed URLs yield a WebError
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        session = await self._get_aio_session()
+        request_headers = {**(headers or {}), 'User-Agent': self.user_agent}
+
+        async def fetch(url: str) -> Any:
+            async with semaphore, session.get(url, headers=request_headers) as response:
+                response.raise_for_status()
+                if 'json' in response.headers.get('Content-Type', ''):
+                    return orjson.loads(await response.read())
+                return await response.text()
+
+        async def fetch_with_retry(url: str) -> Any:
+            try:
+                async for attempt in AsyncRetrying(
+                    stop=stop_after_attempt(self.max_retries),
+                    wait=wait_exponential(multiplier=1, min=1, max=10),
+                    retry=retry_if_exception(_is_retryable),
+                    reraise=True
+                ):
+                    with attempt:
+                        return await fetch(url)
+            except Exception as e:
+                raise WebError(f"Async request failed for {url}: {e}", e)
+
+        return await asyncio.gather(
+            *(fetch_with_retry(url) for url in urls),
+            return_exceptions=True
+        )
+
     def parse_html(
         self,
         html: str,
-        parser: str = 'html.parser'
+        parser: Optional[str] = None
     ) -> BeautifulSoup:
         """Parse HTML content.
 
         Args:
             html (str): HTML content
-            parser (str): HTML parser to use
+            parser (str, optional): HTML parser to use; by default 'lxml' is used
+                for documents of at least WEBTOOLS_LXML_MIN_BYTES (64 KiB) when
+                installed, and 'html.parser' otherwise
 
         Returns:
             BeautifulSoup: Parsed HTML
         """
+        if parser is None:
+            parser = 'lxml' if _HAS_LXML and len(html) >= LXML_MIN_BYTES else 'html.parser'
         try:
             return BeautifulSoup(html, parser)
         except Exception as e:
@@ -252,19 +415,34 @@ class WebTools:
     def extract_text(
         self,
         html: str,
-        exclude_tags: Optional[List[str]] = None
+        exclude_tags: Optional[List[str]] = None,
+        parser: Optional[str] = None
     ) -> str:
         """Extract text from HTML content.
 
+        Uses selectolax when it is installed; pass ``parser`` to force
+        BeautifulSoup with that parser instead.
+
         Args:
             html (str): HTML content
             exclude_tags (list, optional): Tags to exclude
+            parser (str, optional): BeautifulSoup parser to use
 
         Returns:
             str: Extracted text
         """
         try:
-            soup = self.parse_html(html)
+            if (parser is None and _FastHTML is not None and exclude_tags
+                    and _RAW_TEXT_TAGS.issuperset(exclude_tags)):
+                return self.extract_text_fast(html, exclude_tags)
+
+            if parser is None and _FastHTML is not None:
+                tree = _FastHTML(html)
+                if exclude_tags:
+                    tree.strip_tags(exclude_tags)
+                return tree.body.text(separator=' ', strip=True)
+
+            soup = self.parse_html(html, parser)
             if exclude_tags:
                 for tag in exclude_tags:
                     for element in soup.find_all(tag):
@@ -273,29 +451,68 @@ class WebTools:
         except Exception as e:
             raise WebError(f"Error extracting text: {e}", e)
 
+    def extract_text_fast(
+        self,
+        html: Union[str, bytes],
+        exclude_tags: Optional[List[str]] = None
+    ) -> str:
+        """Extract text, cutting script/style blocks out before parsing.
+
+        The excluded blocks are removed with a single regex pass over the raw
+        markup (str or response bytes), so the parser never builds nodes for
+        them. Only 'script', 'style' and 'noscript' may be excluded this way.
+
+        Args:
+            html (str or bytes): HTML content
+            exclude_tags (list, optional): Raw-text tags to drop; defaults to
+                script and style
+
+        Returns:
+            str: Extracted text
+        """
+        tags = frozenset(exclude_tags or ('script', 'style'))
+        if not _RAW_TEXT_TAGS.issuperset(tags):
+            raise WebError(f"Only {sorted(_RAW_TEXT_TAGS)} can be excluded by extract_text_fast")
+        if _FastHTML is None:
+            raise WebError("extract_text_fast requires selectolax")
+        try:
+            cleaned = _raw_text_tag_re(tags, isinstance(html, bytes)).sub(html[:0], html)
+            return _FastHTML(cleaned).body.text(separator=' ', strip=True)
+        except Exception as e:
+            raise WebError(f"Error extracting text: {e}", e)
+
     def extract_links(
         self,
         html: str,
         base_url: str,
-        filter_domain: bool = True
+        filter_domain: bool = True,
+        parser: Optional[str] = None
     ) -> List[str]:
         """Extract links from HTML content.
 
+        Uses selectolax when it is installed; pass ``parser`` to force
+        BeautifulSoup with that parser instead.
+
         Args:
             html (str): HTML content
             base_url (str): Base URL for relative links
             filter_domain (bool): Whether to filter by domain
+            parser (str, optional): BeautifulSoup parser to use
 
         Returns:
             list: List of extracted links
         """
         try:
-            soup = self.parse_html(html)
+            if parser is None and _FastHTML is not None:
+                hrefs = (node.attributes.get('href') for node in _FastHTML(html).css('a[href]'))
+            else:
+                soup = self.parse_html(html, parser)
+                hrefs = (a['href'] for a in soup.find_all('a', href=True))
+
             domain = self.extract_domain(base_url)
             links = []
 
-            for a in soup.find_all('a', href=True):
-                href = a['href']
+            for href in hrefs:
                 if not href:
                     continue
 
@@ -304,7 +521,7 @@ class WebTools:
                     href = urljoin(base_url, href)
 
                 # Filter by domain if requested
-                if filter_domain and domain != self.extract_domain(href):
+                if filter_domain and domain != _cached_split(href).netloc:
                     continue
 
                 links.append(href)
@@ -328,26 +545,30 @@ class WebTools:
             Callable: Decorated function
         """
         def decorator(func: Callable) -> Callable:
-            call_times = []
-            
+            call_times = deque()
+            lock = threading.Lock()
+
             @wraps(func)
             def wrapper(*args, **kwargs):
-                nonlocal call_times
-                
-                # Remove old timestamps
-                call_times = [t for t in call_times if time.time() - t < period]
-                
-                if len(call_times) >= calls:
-                    sleep_time = period - (time.time() - call_times[0])
-                    if sleep_time > 0:
-                        logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-                        time.sleep(sleep_time)
-                
-                call_times.append(time.time())
+                with lock:
+                    now = time.monotonic()
+
+                    # Drop timestamps that have left the window
+                    while call_times and now - call_times[0] >= period:
+                        call_times.popleft()
+
+                    if len(call_times) >= calls:
+                        sleep_time = period - (now - call_times[0])
+                        if sleep_time > 0:
+                            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+                            time.sleep(sleep_time)
+                        call_times.popleft()
+
+                    call_times.append(time.monotonic())
                 return func(*args, **kwargs)
-            
+
             return wrapper
-        
+
         return decorator
 
     def cache_response(
@@ -364,10 +585,10 @@ class WebTools:
         """
         @wraps(func)
         def wrapper(*args, **kwargs):
-            cache_key = f"{func.__name__}:{args}:{kwargs}"
-            
+            cache_key = _request_cache_key(func.__name__, args, kwargs)
+
             if cache_key in self.cache:
-                logger.debug(f"Cache hit for {cache_key}")
+                logger.debug(f"Cache hit for {func.__name__}")
                 return self.cache[cache_key]
             
             result = func(*args, **kwargs)
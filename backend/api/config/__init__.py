@@ -55,36 +55,73 @@ Example:
 """
 
 import os
-import json
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+import threading
+from dataclasses import make_dataclass
+from typing import Any, ClassVar, Dict, Optional, Tuple
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson wheels are not available on every platform
+    from json import loads as _json_loads
 
 from .database import DatabaseConfig
 from .logging import LoggingConfig
 from .security import SecurityConfig
 from .server import ServerConfig
 
+# Parsed config.json files, keyed by (path, st_mtime_ns)
+_JSON_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+_JSON_CACHE_LOCK = threading.Lock()
+
+# Generated section classes, keyed by (section name, field names and types)
+_SECTION_TYPES: Dict[Tuple[str, Tuple[Tuple[str, type], ...]], type] = {}
+
+
+def _load_json(file_path: str) -> Dict[str, Any]:
+    """
+    Parse a JSON config file, reusing the result until its mtime changes.
+
+    Args:
+        file_path (str): Path to the JSON file.
+
+    Returns:
+        Dict[str, Any]: The parsed file contents.
+    """
+    key = (file_path, os.stat(file_path).st_mtime_ns)
+    with _JSON_CACHE_LOCK:
+        data = _JSON_CACHE.get(key)
+        if data is None:
+            with open(file_path, "rb") as file:
+                data = _json_loads(file.read())
+            # Drop entries for older versions of this file
+            for stale in [k for k in _JSON_CACHE if k[0] == file_path]:
+                del _JSON_CACHE[stale]
+            _JSON_CACHE[key] = data
+    return data
+
 
-@dataclass
 class Config:
     """
     Base class for configuration sections.
 
+    ``load`` returns an instance of a dataclass generated for the section
+    with ``slots=True``, so settings are plain slot attributes rather than
+    lookups in a dict.
+
     Attributes:
         name (str): The name of the section.
-        settings (Dict[str, Any]): The settings for the section.
     """
 
-    name: str
-    settings: Dict[str, Any]
+    name: ClassVar[str]
 
     @classmethod
-    def load(cls) -> "Config":
+    def load(cls) -> Any:
         """
         Load the configuration from environment variables and JSON file.
 
         Returns:
-            Config: The loaded configuration.
+            Any: The loaded configuration, an instance of the section's
+                slotted dataclass.
         """
         # Load from environment variables
         settings = {}
@@ -95,32 +132,15 @@ class Config:
         # Load from JSON file
         file_path = os.path.join(os.path.dirname(__file__), "config.json")
         if os.path.exists(file_path):
-            with open(file_path) as file:
-                json_settings = json.load(file)
-                settings.update(json_settings.get(cls.name, {}))
-
-        return cls(settings=settings)
-
-    def __getattr__(self, name: str) -> Any:
-        """
-        Get a setting value.
-
-        Args:
-            name (str): The name of the setting.
-
-        Returns:
-            Any: The value of the setting.
-        """
-        return self.settings.get(name)
-
-    def __setattr__(self, name: str, value: Any) -> None:
-        """
-        Set a setting value.
-
-        Args:
-            name (str): The name of the setting.
-            value (Any): The value of the setting.
-        """
-        if name not in self.settings:
-            raise AttributeError(f"{self.name} has no attribute {name}")
-        self.settings[name] = value
+            json_settings = _load_json(file_path)
+            settings.update(json_settings.get(cls.name, {}))
+
+        fields = tuple((key, type(value)) for key, value in settings.items())
+        section_cls = _SECTION_TYPES.get((cls.name, fields))
+        if section_cls is None:
+            section_cls = make_dataclass(
+                f"{cls.name.title()}Cfg", fields, slots=True
+            )
+            _SECTION_TYPES[(cls.name, fields)] = section_cls
+
+        return section_cls(**settings)
@@ -1,28 +1,186 @@
 # backend/api/config/database.py
+import uuid
 import logging
-from sqlalchemy import create_engine, MetaData
+from collections.abc import Mapping
+from sqlalchemy import create_engine, MetaData, Text, cast, type_coerce
+from sqlalchemy.engine import make_url
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from sqlalchemy.types import TypeDecorator
 from databases import Database
-from .settings import settings
+from .settings import get_settings
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
-# Database setup
-database = Database(settings.database_url)
+# Each worker process gets an equal share of the connection budget so that
+# pool_size * workers stays below PostgreSQL's max_connections
+WORKER_POOL_SIZE = max(1, settings.database_pool_size // settings.worker_count)
+WORKER_MAX_OVERFLOW = settings.database_max_overflow // settings.worker_count
+
+# The worker's share is split between the health-check pool and the async
+# engine that serves requests; the sync engine does not hold connections
+HEALTH_POOL_SIZE = 1
+ASYNC_POOL_SIZE = max(1, WORKER_POOL_SIZE - HEALTH_POOL_SIZE)
+
+if settings.database_transaction_pooling:
+    # PgBouncer hands each transaction to any server connection, so prepared
+    # statements cannot be cached, and it rejects startup options (JIT is
+    # disabled on the server instead)
+    _async_options = {"statement_cache_size": 0}
+    _connect_args = {}
+    _asyncpg_connect_args = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        # Backends are shared between clients; unique names avoid collisions
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    }
+else:
+    _async_options = {}
+    # JIT compilation only pays off for long analytical queries
+    _connect_args = {"options": "-c jit=off"}
+    _asyncpg_connect_args = {"server_settings": {"jit": "off"}}
+
+# Health checks; the pool is opened by database.connect() during app startup
+database = Database(
+    settings.database_url, min_size=1, max_size=HEALTH_POOL_SIZE, **_async_options
+)
 metadata = MetaData()
 
+# Sync engine for startup DDL and scripts only; connections are closed after use
 engine = create_engine(
     settings.database_url,
-    pool_size=settings.database_pool_size,
-    max_overflow=settings.database_max_overflow,
-    pool_pre_ping=True,
+    poolclass=NullPool,
+    connect_args=_connect_args,
     echo=settings.debug
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Async engine for request handlers, so queries do not block the event loop
+async_engine = create_async_engine(
+    make_url(settings.database_url).set(drivername="postgresql+asyncpg"),
+    pool_size=ASYNC_POOL_SIZE,
+    max_overflow=WORKER_MAX_OVERFLOW,
+    pool_pre_ping=settings.db_pre_ping,
+    pool_recycle=settings.database_pool_recycle,
+    pool_use_lifo=True,
+    connect_args=_asyncpg_connect_args,
+    echo=settings.debug
+)
+
+# Objects stay usable after commit; expired attributes cannot lazy-load
+# outside the session's greenlet
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson wheels are not available on every platform
+    from json import loads as _json_loads
+
+_UNPARSED = object()
+
+class LazyJsonView(Mapping):
+    """Read-only mapping over a raw JSON document.
+
+    Construction only stores the raw text; the document is parsed on first
+    key access and the result is memoized. A JSON ``null`` document reads as
+    an empty mapping.
+
+    The view cannot be modified in place: to change a column such as
+    ``definition`` or ``preferences``, copy it with ``dict()`` and assign the
+    new dict back to the attribute.
+    """
+    
+    __slots__ = ("_raw", "_data")
+    
+    def __init__(self, raw):
+        self._raw = raw
+        self._data = _UNPARSED
+    
+    def _load(self):
+        if self._data is _UNPARSED:
+            data = _json_loads(self._raw)
+            self._data = {} if data is None else data
+            self._raw = None
+        return self._data
+    
+    def __getitem__(self, key):
+        return self._load()[key]
+    
+    def __iter__(self):
+        return iter(self._load())
+    
+    def __len__(self):
+        return len(self._load())
+    
+    def __repr__(self):
+        return f"LazyJsonView({self._load()!r})"
+
+class LazyJSON(TypeDecorator):
+    """JSONB column loaded as a LazyJsonView instead of a parsed dict.
+
+    The column is selected as text so the driver skips its JSON decoding;
+    rows that are never inspected are never parsed.
+    """
+    
+    impl = JSONB
+    cache_ok = True
+    
+    def column_expression(self, column):
+        return type_coerce(cast(column, Text), self)
+    
+    def process_bind_param(self, value, dialect):
+        if isinstance(value, LazyJsonView):
+            return dict(value)
+        return value
+    
+    def process_result_value(self, value, dialect):
+        # A JSON null document loads as None, like SQL NULL
+        if value == "null" or value == b"null":
+            return None
+        if isinstance(value, (str, bytes)):
+            return LazyJsonView(value)
+        return value
+
+class FastEnum(TypeDecorator):
+    """Native PostgreSQL enum column storing the members' values.
+
+    Rows are mapped back to members with a single dict lookup built once
+    per column type.
+    """
+    
+    impl = SAEnum
+    cache_ok = True
+    
+    def __init__(self, enum_class, name=None):
+        self.enum_class = enum_class
+        self.name = name
+        self._lookup = {member.value: member for member in enum_class}
+        super().__init__(
+            enum_class,
+            name=name,
+            native_enum=True,
+            create_constraint=False,
+            values_callable=lambda e: [member.value for member in e],
+        )
+    
+    def result_processor(self, dialect, coltype):
+        lookup = self._lookup
+        
+        def process(value):
+            if value is None:
+                return None
+            return lookup[value]
+        
+        return process
+
 # Dependency
 def get_db():
     db = SessionLocal()
@@ -31,13 +189,17 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
 # backend/api/models/user.py
-from sqlalchemy import Column, String, Boolean, DateTime, Text, Enum
+from sqlalchemy import Column, String, Boolean, DateTime, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
 import enum
-from ..config.database import Base
+from ..config.database import Base, FastEnum, LazyJSON
 
 class UserRole(str, enum.Enum):
     ADMIN = "admin"
@@ -47,6 +209,14 @@ class UserRole(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index(
+            "idx_users_preferences",
+            "preferences",
+            postgresql_using="gin",
+            postgresql_ops={"preferences": "jsonb_path_ops"},
+        ),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String(255), unique=True, nullable=False, index=True)
@@ -54,23 +224,23 @@ class User(Base):
     password_hash = Column(String(255), nullable=False)
     first_name = Column(String(100))
     last_name = Column(String(100))
-    role = Column(Enum(UserRole), default=UserRole.VIEWER)
+    role = Column(FastEnum(UserRole, name="user_role"), default=UserRole.VIEWER)
     is_active = Column(Boolean, default=True)
     is_verified = Column(Boolean, default=False)
     avatar_url = Column(Text)
-    preferences = Column(Text)  # JSON as text
+    preferences = Column(LazyJSON, default=dict)
     last_login_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 # backend/api/models/workflow.py
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, Enum, ARRAY
+from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, ARRAY
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
 import enum
-from ..config.database import Base
+from ..config.database import Base, LazyJSON
 
 class WorkflowStatus(str, enum.Enum):
     DRAFT = "draft"
@@ -86,12 +256,12 @@ class Workflow(Base):
     description = Column(Text)
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"))
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    status = Column(Enum(WorkflowStatus), default=WorkflowStatus.DRAFT)
-    definition = Column(JSONB, nullable=False, default={})
-    metadata = Column(JSONB, default={})
+    status = Column(FastEnum(WorkflowStatus, name="workflow_status"), default=WorkflowStatus.DRAFT)
+    definition = Column(LazyJSON, nullable=False, default=dict)
+    metadata = Column(LazyJSON, default=dict)
     version = Column(Integer, default=1)
     is_template = Column(Boolean, default=False)
-    tags = Column(ARRAY(String), default=[])
+    tags = Column(ARRAY(String), default=list)
     category = Column(String(100))
     
     # Statistics
@@ -125,11 +295,11 @@ class WorkflowNode(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     workflow_id = Column(UUID(as_uuid=True), ForeignKey("workflows.id"), nullable=False)
     name = Column(String(255), nullable=False)
-    type = Column(Enum(NodeType), nullable=False)
+    type = Column(FastEnum(NodeType, name="node_type"), nullable=False)
     position_x = Column(Integer, nullable=False, default=0)
     position_y = Column(Integer, nullable=False, default=0)
-    config = Column(JSONB, nullable=False, default={})
-    metadata = Column(JSONB, default={})
+    config = Column(LazyJSON, nullable=False, default=dict)
+    metadata = Column(LazyJSON, default=dict)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
@@ -145,7 +315,7 @@ class WorkflowConnection(Base):
     target_node_id = Column(UUID(as_uuid=True), ForeignKey("workflow_nodes.id"), nullable=False)
     source_port = Column(String(100), default="output")
     target_port = Column(String(100), default="input")
-    metadata = Column(JSONB, default={})
+    metadata = Column(LazyJSON, default=dict)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
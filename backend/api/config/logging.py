@@ -4,6 +4,9 @@ import os
 from logging.handlers import RotatingFileHandler
 from typing import Optional
 
+# Marks handlers installed by setup_logging so repeat calls can reuse them
+_HANDLER_TAG = "main"
+
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
@@ -12,6 +15,10 @@ def setup_logging(
     """
     Configure application logging with consistent formatting and output handling.
     
+    Safe to call more than once: if the handlers from a previous call are
+    still installed only the level is updated, so file handlers are not
+    reopened.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional path to log file for file-based logging
@@ -31,6 +38,10 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
     
+    # Already configured by an earlier call
+    if any(getattr(h, "_app_tag", None) == _HANDLER_TAG for h in root_logger.handlers):
+        return
+    
     # Clear existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
@@ -38,6 +49,7 @@ def setup_logging(
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(logging.Formatter(log_format))
+    console_handler._app_tag = _HANDLER_TAG
     root_logger.addHandler(console_handler)
     
     # Add file handler if log file is specified
@@ -49,4 +61,9 @@ def setup_logging(
             backupCount=5
         )
         file_handler.setFormatter(logging.Formatter(log_format))
+        file_handler._app_tag = _HANDLER_TAG
         root_logger.addHandler(file_handler)
+    
+    # Suppress verbose loggers
+    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
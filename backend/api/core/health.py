@@ -1,103 +1,154 @@
 # backend/api/core/health.py
 import time
+import asyncio
 import logging
-from typing import Dict, Any
+from typing import Awaitable, Dict, Any, Optional, Tuple
 from datetime import datetime
+from sqlalchemy import text
 from ..config.database import database
-from ..config.settings import settings
+from ..config.settings import get_settings
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Upper bound for a single check so a hung dependency cannot stall probes
+CHECK_TIMEOUT_SECONDS = 2.0
+
+# Compiled once and reused by every database check
+_PING = text("SELECT 1")
+
+# How long a health report is served before it is refreshed
+HEALTH_CACHE_TTL_SECONDS = 1.0
+
+_time = time.time
+_utcfromtimestamp = datetime.utcfromtimestamp
+
+# [iso string, epoch second it was formatted for]
+_ts_cache = ["", 0]
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO-8601 string, reformatted at most once a second."""
+    t = int(_time())
+    if t != _ts_cache[1]:
+        _ts_cache[:] = [_utcfromtimestamp(t).isoformat() + "Z", t]
+    return _ts_cache[0]
+
+def _unhealthy(error: str) -> Dict[str, Any]:
+    """Result for a failed check."""
+    return {"healthy": False, "error": error, "timestamp": _iso_now()}
 
 class HealthChecker:
     """Centralized health checking service."""
     
-    def __init__(self):
+    __slots__ = ("start_time", "cache_ttl", "_cache", "_refresh_task", "_lock")
+    
+    def __init__(self, cache_ttl: float = HEALTH_CACHE_TTL_SECONDS):
         self.start_time = time.time()
-        self.checks = {
-            "database": self._check_database,
-            "redis": self._check_redis,
-            "external_apis": self._check_external_apis
-        }
+        self.cache_ttl = cache_ttl
+        self._cache: Optional[Tuple[float, Dict[str, Any]]] = None  # (expires_at, report)
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
     
     async def get_health_status(self) -> Dict[str, Any]:
-        """Get comprehensive health status."""
+        """
+        Get comprehensive health status.
+        
+        Reports are cached for ``cache_ttl`` seconds. Once expired, the stale
+        report is still returned while a single background task refreshes it;
+        only the very first call waits for the checks to run.
+        """
+        cached = self._cache
+        if cached is None:
+            return await self._refresh()
+        
+        expires_at, report = cached
+        if time.monotonic() >= expires_at and (
+            self._refresh_task is None or self._refresh_task.done()
+        ):
+            self._refresh_task = asyncio.create_task(self._refresh())
+        return report
+    
+    async def _refresh(self) -> Dict[str, Any]:
+        """Run the checks and store the report, deduplicating concurrent refreshes."""
+        async with self._lock:
+            cached = self._cache
+            if cached is not None and time.monotonic() < cached[0]:
+                return cached[1]
+            report = await self._collect_health_status()
+            self._cache = (time.monotonic() + self.cache_ttl, report)
+            return report
+    
+    async def _collect_health_status(self) -> Dict[str, Any]:
+        """Run every health check and build the report."""
         health_data = {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _iso_now(),
             "uptime_seconds": time.time() - self.start_time,
             "version": "1.0.0",
             "environment": settings.environment,
             "checks": {}
         }
         
-        overall_healthy = True
-        
-        # Run all health checks
-        for check_name, check_func in self.checks.items():
-            try:
-                check_result = await check_func()
-                health_data["checks"][check_name] = check_result
-                
-                if not check_result.get("healthy", False):
-                    overall_healthy = False
-                    
-            except Exception as e:
-                logger.error(f"Health check {check_name} failed: {e}")
-                health_data["checks"][check_name] = {
-                    "healthy": False,
-                    "error": str(e),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                overall_healthy = False
+        # Run all health checks concurrently
+        results = await asyncio.gather(
+            *(self._run_check(name, check(self)) for name, check in _CHECKS)
+        )
+        health_data["checks"] = dict(results)
+        overall_healthy = all(
+            result.get("healthy", False) for _, result in results
+        )
         
         health_data["status"] = "healthy" if overall_healthy else "degraded"
         return health_data
     
+    async def _run_check(
+        self,
+        check_name: str,
+        check: Awaitable[Dict[str, Any]]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Run one check with a timeout, turning failures into an unhealthy result."""
+        try:
+            result = await asyncio.wait_for(check, timeout=CHECK_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.error(f"Health check {check_name} timed out after {CHECK_TIMEOUT_SECONDS}s")
+            result = _unhealthy(f"timed out after {CHECK_TIMEOUT_SECONDS}s")
+        except Exception as e:
+            logger.error(f"Health check {check_name} failed: {e}")
+            result = _unhealthy(str(e))
+        return check_name, result
+    
     async def _check_database(self) -> Dict[str, Any]:
         """Check database connectivity."""
         try:
-            await database.fetch_one("SELECT 1")
-            return {
-                "healthy": True,
-                "response_time_ms": 0,  # TODO: Measure actual response time
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            started = time.perf_counter_ns()
+            await database.fetch_one(_PING)
+            elapsed_ms = (time.perf_counter_ns() - started) / 1_000_000
+            return {"healthy": True, "response_time_ms": round(elapsed_ms, 3), "timestamp": _iso_now()}
         except Exception as e:
-            return {
-                "healthy": False,
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            return _unhealthy(str(e))
     
     async def _check_redis(self) -> Dict[str, Any]:
         """Check Redis connectivity."""
         try:
             # TODO: Implement Redis health check
-            return {
-                "healthy": True,
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            return {"healthy": True, "timestamp": _iso_now()}
         except Exception as e:
-            return {
-                "healthy": False,
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            return _unhealthy(str(e))
     
     async def _check_external_apis(self) -> Dict[str, Any]:
         """Check external API connectivity."""
         try:
             # TODO: Implement external API health checks
-            return {
-                "healthy": True,
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            return {"healthy": True, "timestamp": _iso_now()}
         except Exception as e:
-            return {
-                "healthy": False,
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            return _unhealthy(str(e))
+
+# Checks run by get_health_status, in report order
+_CHECKS = (
+    ("database", HealthChecker._check_database),
+    ("redis", HealthChecker._check_redis),
+    ("external_apis", HealthChecker._check_external_apis),
+)
 
 # Global health checker instance
 health_checker = HealthChecker()
\ No newline at end of file
@@ -6,37 +6,39 @@ It sets up the FastAPI application with all routes, middleware, and configuratio
 """
 
 import os
+import time
+import asyncio
 import logging
+import importlib
 from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any
 
 from fastapi import FastAPI, Request, HTTPException
+from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+import orjson
+import redis.asyncio as redis
 from fastapi.staticfiles import StaticFiles
+from starlette.middleware.exceptions import ExceptionMiddleware
 import uvicorn
 
 # Import configuration and database
-from config.settings import settings
-from config.database import database, engine, metadata
+from config.settings import get_settings
+from config.database import async_engine, database, engine, metadata
 from config.logging import setup_logging
 
 # Import middleware
 from middleware.auth import AuthMiddleware
-from middleware.cors import setup_cors
+from middleware.client_ip import ClientIPMiddleware
+from middleware.cors import cors_options, setup_cors
+from middleware.fastpath import FastPathMiddleware
 from middleware.logging import LoggingMiddleware
-from middleware.rate_limit import RateLimitMiddleware
-
-# Import routes
-from routes import (
-    workflows,
-    agents, 
-    auth,
-    executions,
-    templates,
-    integrations
-)
+from middleware.rate_llimiting import RateLimitMiddleware
 
 # Import utilities
 from utils.exceptions import (
@@ -46,10 +48,47 @@ from utils.exceptions import (
     AuthenticationException
 )
 
+settings = get_settings()
+
 # Set up logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Shared Redis pool. Creating the client opens no connections; lifespan
+# startup verifies it and publishes it on app.state.redis for middleware.
+redis_client = redis.from_url(settings.redis_url, max_connections=50)
+
+# Route modules mounted at startup: (module, prefix, tag)
+ROUTE_MODULES = (
+    ("auth", "/auth", "Authentication"),
+    ("workflows", "/workflows", "Workflows"),
+    ("agents", "/agents", "Agents"),
+    ("executions", "/executions", "Executions"),
+    ("templates", "/templates", "Templates"),
+    ("integrations", "/integrations", "Integrations"),
+)
+
+
+def _register_routes(app: FastAPI) -> None:
+    """
+    Import the enabled route modules and mount their routers.
+
+    Route modules pull in models, schemas and provider SDKs, so they are
+    imported here during startup instead of at module import time.
+    """
+    if getattr(app.state, "routes_registered", False):
+        return
+    
+    enabled = set(settings.enabled_routes)
+    for module_name, prefix, tag in ROUTE_MODULES:
+        if module_name not in enabled:
+            logger.info(f"Route module '{module_name}' disabled by configuration")
+            continue
+        module = importlib.import_module(f"routes.{module_name}")
+        app.include_router(module.router, prefix=prefix, tags=[tag])
+    
+    app.state.routes_registered = True
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -74,6 +113,20 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️ Database table initialization warning: {e}")
     
+    # Warm the Redis pool before the first request needs it
+    try:
+        await redis_client.ping()
+        app.state.redis = redis_client
+        logger.info("✅ Redis connected successfully")
+    except Exception as e:
+        # None makes rate limiting fall back to the per-process limiter
+        app.state.redis = None
+        logger.warning(f"⚠️ Redis unavailable, using in-memory rate limiting: {e}")
+    
+    # Mount API routes
+    _register_routes(app)
+    logger.info("✅ API routes registered")
+    
     # Additional startup tasks
     logger.info("✅ API startup completed")
     
@@ -82,10 +135,44 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("🛑 Shutting down Agent Workflow Builder API...")
     await database.disconnect()
+    await async_engine.dispose()
     logger.info("✅ Database disconnected")
+    await redis_client.close()
+    logger.info("✅ Redis disconnected")
     logger.info("✅ API shutdown completed")
 
 
+# =============================================================================
+# MIDDLEWARE SETUP
+# =============================================================================
+
+# Listed outermost first. Rate limiting runs before authentication so
+# abusive unauthenticated traffic is rejected without decoding a JWT.
+middleware = [
+    # Resolve the client IP once for logging and rate limiting
+    Middleware(ClientIPMiddleware),
+    # CORS Middleware
+    Middleware(CORSMiddleware, **cors_options(settings.cors_origins)),
+]
+
+# Trusted Host Middleware (security)
+if settings.environment == "production":
+    middleware.append(
+        Middleware(TrustedHostMiddleware, allowed_hosts=settings.allowed_hosts)
+    )
+
+# Compress JSON bodies above ~1 KB; level 5 keeps CPU cost low
+middleware.append(Middleware(GZipMiddleware, minimum_size=1000, compresslevel=5))
+
+# Custom Middleware
+middleware += [
+    Middleware(LoggingMiddleware),
+    # Uses the Redis client published on app.state.redis at startup
+    Middleware(RateLimitMiddleware, requests_per_minute=settings.rate_limit_per_minute),
+    Middleware(AuthMiddleware),
+]
+
+
 # Create FastAPI application
 app = FastAPI(
     title="Agent Workflow Builder API",
@@ -128,44 +215,49 @@ app = FastAPI(
         "url": "https://opensource.org/licenses/MIT",
     },
     lifespan=lifespan,
+    middleware=middleware,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.environment != "production" else None,
     redoc_url="/redoc" if settings.environment != "production" else None,
     openapi_url="/openapi.json" if settings.environment != "production" else None,
 )
 
+# Outermost: health probes, the root endpoint and static assets go straight
+# to the router (with default HTTPException handling), bypassing the stack
+app.add_middleware(FastPathMiddleware, fast_app=ExceptionMiddleware(app.router))
+
 # =============================================================================
-# MIDDLEWARE SETUP
+# EXCEPTION HANDLERS
 # =============================================================================
 
-# CORS Middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+@lru_cache(maxsize=256)
+def _static_error_body(error: str, message: str) -> bytes:
+    """Serialized error body for a request without a request_id."""
+    return orjson.dumps({"error": error, "message": message, "request_id": None})
 
-# Trusted Host Middleware (security)
-if settings.environment == "production":
-    app.add_middleware(
-        TrustedHostMiddleware,
-        allowed_hosts=settings.allowed_hosts
+def _error_response(request: Request, status_code: int, error: str, message: Any) -> Response:
+    """
+    Build a ``{error, message, request_id}`` response.
+    
+    Bodies without a request_id are identical per (error, message), so they
+    are serialized once and reused.
+    """
+    request_id = getattr(request.state, "request_id", None)
+    if request_id is None and isinstance(message, str):
+        return Response(
+            content=_static_error_body(error, message),
+            status_code=status_code,
+            media_type="application/json",
+        )
+    return ORJSONResponse(
+        status_code=status_code,
+        content={"error": error, "message": message, "request_id": request_id},
     )
 
-# Custom Middleware
-app.add_middleware(LoggingMiddleware)
-app.add_middleware(RateLimitMiddleware)
-app.add_middleware(AuthMiddleware)
-
-# =============================================================================
-# EXCEPTION HANDLERS
-# =============================================================================
-
 @app.exception_handler(CustomHTTPException)
 async def custom_http_exception_handler(request: Request, exc: CustomHTTPException):
     """Handle custom HTTP exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.error_type,
@@ -178,7 +270,7 @@ async def custom_http_exception_handler(request: Request, exc: CustomHTTPExcepti
 @app.exception_handler(ValidationException)
 async def validation_exception_handler(request: Request, exc: ValidationException):
     """Handle validation exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "error": "validation_error",
@@ -192,77 +284,71 @@ async def validation_exception_handler(request: Request, exc: ValidationExceptio
 async def database_exception_handler(request: Request, exc: DatabaseException):
     """Handle database exceptions."""
     logger.error(f"Database error: {exc}")
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "database_error",
-            "message": "A database error occurred",
-            "request_id": getattr(request.state, "request_id", None),
-        }
-    )
+    return _error_response(request, 500, "database_error", "A database error occurred")
 
 @app.exception_handler(AuthenticationException)
 async def auth_exception_handler(request: Request, exc: AuthenticationException):
     """Handle authentication exceptions."""
-    return JSONResponse(
-        status_code=401,
-        content={
-            "error": "authentication_error",
-            "message": exc.detail,
-            "request_id": getattr(request.state, "request_id", None),
-        }
-    )
+    return _error_response(request, 401, "authentication_error", exc.detail)
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle standard HTTP exceptions."""
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error": "http_error",
-            "message": exc.detail,
-            "request_id": getattr(request.state, "request_id", None),
-        }
-    )
+    return _error_response(request, exc.status_code, "http_error", exc.detail)
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions."""
     logger.error(f"Unexpected error: {exc}", exc_info=True)
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "internal_server_error",
-            "message": "An unexpected error occurred",
-            "request_id": getattr(request.state, "request_id", None),
-        }
-    )
+    return _error_response(request, 500, "internal_server_error", "An unexpected error occurred")
 
 # =============================================================================
 # ROUTE REGISTRATION
 # =============================================================================
 
+# Seconds a database probe result is reused; shorter than the k8s probe period
+HEALTH_CACHE_TTL = 5.0
+HEALTH_DB_TIMEOUT = 1.0
+
+# Last probe result: monotonic time of the probe and the response payload
+_health_cache: Dict[str, Any] = {"ts": float("-inf"), "payload": None}
+_health_lock = asyncio.Lock()
+
 # Health check endpoint
 @app.get("/health", tags=["Health"])
 async def health_check() -> Dict[str, Any]:
     """
     Health check endpoint for monitoring and load balancers.
+    
+    The database probe result is cached for HEALTH_CACHE_TTL seconds so
+    frequent probes do not compete with real traffic for pool connections.
     """
-    try:
-        # Check database connectivity
-        await database.fetch_one("SELECT 1")
-        db_status = "healthy"
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        db_status = "unhealthy"
+    if time.monotonic() - _health_cache["ts"] < HEALTH_CACHE_TTL:
+        return _health_cache["payload"]
     
-    return {
-        "status": "healthy" if db_status == "healthy" else "degraded",
-        "version": "1.0.0",
-        "environment": settings.environment,
-        "database": db_status,
-        "timestamp": "2024-01-01T00:00:00Z",  # Use actual timestamp
-    }
+    async with _health_lock:
+        # Another request may have refreshed the cache while we waited
+        if time.monotonic() - _health_cache["ts"] < HEALTH_CACHE_TTL:
+            return _health_cache["payload"]
+        
+        try:
+            # Check database connectivity
+            await asyncio.wait_for(database.fetch_one("SELECT 1"), timeout=HEALTH_DB_TIMEOUT)
+            db_status = "healthy"
+        except Exception as e:
+            logger.error(f"Database health check failed: {e!r}")
+            db_status = "unhealthy"
+        
+        payload = {
+            "status": "healthy" if db_status == "healthy" else "degraded",
+            "version": "1.0.0",
+            "environment": settings.environment,
+            "database": db_status,
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+        }
+        _health_cache["payload"] = payload
+        _health_cache["ts"] = time.monotonic()
+        return payload
 
 # Root endpoint
 @app.get("/", tags=["Root"])
@@ -278,17 +364,14 @@ async def root() -> Dict[str, str]:
         "status": "running"
     }
 
-# Include API routes with prefixes
-app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
-app.include_router(workflows.router, prefix="/workflows", tags=["Workflows"])
-app.include_router(agents.router, prefix="/agents", tags=["Agents"])
-app.include_router(executions.router, prefix="/executions", tags=["Executions"])
-app.include_router(templates.router, prefix="/templates", tags=["Templates"])
-app.include_router(integrations.router, prefix="/integrations", tags=["Integrations"])
+# API routes are mounted during lifespan startup (see _register_routes)
 
-# Static files (if needed)
-if os.path.exists("static"):
-    app.mount("/static", StaticFiles(directory="static"), name="static")
+# Static files. Behind nginx these are served from disk with sendfile
+# (deploy/nginx/nginx.conf, location /api/static/); set SERVE_STATIC=false
+# there so the API never handles them.
+STATIC_DIR = "static"
+if settings.serve_static and os.path.isdir(STATIC_DIR):
+    app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
 # =============================================================================
 # DEVELOPMENT SERVER
@@ -296,16 +379,21 @@ if os.path.exists("static"):
 
 if __name__ == "__main__":
     # This is only used for development
-    # In production, use: uvicorn main:app --host 0.0.0.0 --port 8000
+    # In production, use: gunicorn main:app -k uvicorn.workers.UvicornWorker --preload
+    # so the app is imported once and workers fork with shared code pages
     
     logger.info("🚀 Starting development server...")
     
+    is_development = settings.environment == "development"
     uvicorn.run(
         "main:app",
         host=settings.api_host,
         port=settings.api_port,
-        reload=settings.environment == "development",
-        log_level="info" if settings.environment == "development" else "warning",
-        access_log=settings.environment == "development",
-        workers=1 if settings.environment == "development" else 4,
+        reload=is_development,
+        # uvloop and httptools ship with uvicorn[standard]
+        loop="uvloop",
+        http="httptools",
+        log_level="info" if is_development else "warning",
+        access_log=is_development,
+        workers=settings.worker_count,
     )
\ No newline at end of file
@@ -0,0 +1,50 @@
+# backend/api/middleware/client_ip.py
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+def _resolve_client_ip(scope: Scope) -> str:
+    """Resolve the client IP from proxy headers, falling back to the peer address."""
+    forwarded_for = None
+    real_ip = None
+    for name, value in scope.get("headers", ()):
+        if name == b"x-forwarded-for" and forwarded_for is None:
+            forwarded_for = value
+        elif name == b"x-real-ip" and real_ip is None:
+            real_ip = value
+
+    # Check for forwarded headers (when behind proxy)
+    if forwarded_for:
+        return forwarded_for.split(b",", 1)[0].strip().decode("latin-1")
+
+    if real_ip:
+        return real_ip.decode("latin-1")
+
+    # Fallback to direct connection
+    client = scope.get("client")
+    if client:
+        return client[0]
+
+    return "unknown"
+
+def get_client_ip(scope: Scope) -> str:
+    """
+    Client IP for a request, parsed once and memoized in the request state.
+
+    Works on the raw ASGI scope, so pure ASGI middleware can use it without
+    building a Request; ``request.state.client_ip`` exposes the same value.
+    """
+    state = scope.setdefault("state", {})
+    client_ip = state.get("client_ip")
+    if client_ip is None:
+        client_ip = state["client_ip"] = _resolve_client_ip(scope)
+    return client_ip
+
+class ClientIPMiddleware:
+    """Resolve the client IP once per request for every downstream layer."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            get_client_ip(scope)
+        await self.app(scope, receive, send)
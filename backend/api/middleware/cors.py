@@ -5,23 +5,37 @@ sharing. This is necessary for the frontend to make requests to the backend
 when hosted on a different domain.
 
 The middleware sets the following headers:
-    - Access-Control-Allow-Origin: *
-    - Access-Control-Allow-Methods: GET, POST, PUT, DELETE, OPTIONS
-    - Access-Control-Allow-Headers: Content-Type, Authorization
+    - Access-Control-Allow-Origin: the request origin, if configured
+    - Access-Control-Allow-Methods: GET, POST, PUT, DELETE, PATCH
+    - Access-Control-Allow-Headers: Authorization, Content-Type, X-Request-ID
+    - Access-Control-Max-Age: 86400 (browsers cache preflights for a day)
 
 The middleware also sets the CORS preflight response to 204 No Content.
 """
 
+from typing import Any, Dict, Iterable
+
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from config.settings import get_settings
+
+ALLOW_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH")
+ALLOW_HEADERS = ("Authorization", "Content-Type", "X-Request-ID")
+PREFLIGHT_MAX_AGE = 86400
+
+def cors_options(origins: Iterable[str]) -> Dict[str, Any]:
+    """Keyword arguments for CORSMiddleware with an explicit origin allowlist."""
+    return {
+        # Origin checks are set lookups
+        "allow_origins": frozenset(origins),
+        "allow_credentials": True,
+        "allow_methods": ALLOW_METHODS,
+        "allow_headers": ALLOW_HEADERS,
+        "max_age": PREFLIGHT_MAX_AGE,
+    }
+
 def setup_cors(app: FastAPI) -> None:
     """Set up CORS middleware for the application"""
 
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    app.add_middleware(CORSMiddleware, **cors_options(get_settings().cors_origins))
@@ -1,43 +1,63 @@
 # backend/api/middleware/error_handling.py
+import os
 import logging
-import traceback
-import uuid
 from datetime import datetime
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from starlette.requests import Request
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from .logging import LazyHeaders
 
 logger = logging.getLogger(__name__)
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
-    """Centralized error handling middleware."""
+class ErrorHandlingMiddleware:
+    """Centralized error handling middleware (pure ASGI)."""
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request = Request(scope)
+        
         # Generate request ID for tracing
-        request_id = str(uuid.uuid4())
+        request_id = os.urandom(8).hex()
         request.state.request_id = request_id
         
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
             
         except Exception as exc:
-            # Log the error with full context
-            logger.error(
-                f"Unhandled exception in request {request_id}",
+            # Log the error with full context; the traceback is only
+            # formatted if a handler actually emits the record
+            logger.exception(
+                "Unhandled exception in request %s",
+                request_id,
                 extra={
                     "request_id": request_id,
                     "method": request.method,
                     "url": str(request.url),
-                    "headers": dict(request.headers),
-                    "exception": str(exc),
-                    "traceback": traceback.format_exc()
+                    "headers": LazyHeaders(request.headers),
+                    "exception": str(exc)
                 }
             )
             
+            # Too late to replace a response that is already being sent
+            if response_started:
+                raise
+            
             # Return generic error response
-            return JSONResponse(
+            response = ORJSONResponse(
                 status_code=500,
                 content={
                     "error": "internal_server_error",
@@ -46,4 +66,4 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
                     "timestamp": datetime.utcnow().isoformat()
                 }
             )
-
+            await response(scope, receive, send)
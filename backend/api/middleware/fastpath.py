@@ -0,0 +1,37 @@
+# backend/api/middleware/fastpath.py
+from typing import Iterable, Optional, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Paths served without running the rest of the middleware stack
+DEFAULT_FAST_PATHS = frozenset({"/health", "/", "/metrics", "/favicon.ico"})
+DEFAULT_FAST_PREFIXES = ("/static/",)
+
+class FastPathMiddleware:
+    """Route probe and static requests straight to a minimal downstream app.
+
+    Requests whose path is in ``paths`` (or starts with one of ``prefixes``)
+    are handed to ``fast_app`` - typically the application's router - instead
+    of ``app``, skipping logging, rate limiting, auth and header middleware.
+    Register it outermost.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        fast_app: ASGIApp,
+        paths: Iterable[str] = DEFAULT_FAST_PATHS,
+        prefixes: Optional[Tuple[str, ...]] = DEFAULT_FAST_PREFIXES
+    ):
+        self.app = app
+        self.fast_app = fast_app
+        self.paths = frozenset(paths)
+        self.prefixes = tuple(prefixes or ())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path in self.paths or (self.prefixes and path.startswith(self.prefixes)):
+                await self.fast_app(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
@@ -19,30 +19,56 @@ Configuration:
 """
 
 # backend/api/middleware/logging.py (Enhanced)
+import os
 import logging
 import time
 import json
-from uuid import uuid4
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from .client_ip import get_client_ip
 
 logger = logging.getLogger("api.requests")
 
-class EnhancedLoggingMiddleware(BaseHTTPMiddleware):
-    """Enhanced logging middleware with structured logging."""
+# Request bodies are logged up to this many bytes
+BODY_LOG_LIMIT = 1000
+
+# Methods whose request bodies are never logged
+_SKIP_BODY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+class LazyHeaders:
+    """Log-record wrapper that only converts headers to a dict when formatted."""
+    
+    __slots__ = ("headers",)
+    
+    def __init__(self, headers):
+        self.headers = headers
+    
+    def __repr__(self) -> str:
+        return repr(dict(self.headers))
     
-    def __init__(self, app, log_body: bool = False, log_headers: bool = False):
-        super().__init__(app)
+    __str__ = __repr__
+
+class EnhancedLoggingMiddleware:
+    """Enhanced logging middleware with structured logging (pure ASGI)."""
+    
+    def __init__(self, app: ASGIApp, log_body: bool = False, log_headers: bool = False):
+        self.app = app
         self.log_body = log_body
         self.log_headers = log_headers
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request = Request(scope)
+        
         # Generate request ID if not exists
-        request_id = getattr(request.state, 'request_id', str(uuid4()))
+        request_id = getattr(request.state, 'request_id', None) or os.urandom(8).hex()
         request.state.request_id = request_id
         
-        start_time = time.time()
+        # Monotonic integer clock for durations; wall time only for the timestamp
+        start_ns = time.monotonic_ns()
         
         # Prepare request log data
         request_data = {
@@ -57,23 +83,33 @@ class EnhancedLoggingMiddleware(BaseHTTPMiddleware):
         }
         
         if self.log_headers:
-            request_data["headers"] = dict(request.headers)
-        
-        # Log request body for non-GET requests
-        if self.log_body and request.method not in ["GET", "HEAD", "OPTIONS"]:
-            try:
-                body = await request.body()
-                if body:
-                    request_data["body_size"] = len(body)
-                    # Only log small bodies to avoid massive logs
-                    if len(body) < 1000:
-                        request_data["body"] = body.decode("utf-8", errors="ignore")
-            except Exception as e:
-                request_data["body_error"] = str(e)
+            request_data["headers"] = LazyHeaders(request.headers)
+        
+        # Log request body for non-GET requests, as the endpoint reads it
+        if self.log_body and request.method not in _SKIP_BODY_METHODS:
+            receive = self._capture_body(receive, request_data)
+        
+        response_info = {"status_code": 500, "response_size": None}
+        
+        request_id_header = (b"x-request-id", request_id.encode("ascii"))
+        
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_info["status_code"] = message["status"]
+                raw_headers = message.get("headers")
+                if not isinstance(raw_headers, list):
+                    raw_headers = message["headers"] = list(raw_headers or ())
+                for name, value in raw_headers:
+                    if name == b"content-length":
+                        response_info["response_size"] = value.decode("latin-1")
+                        break
+                # Add request ID to response headers
+                raw_headers.append(request_id_header)
+            await send(message)
         
         # Process request
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
             # Log exception and re-raise
             logger.error(
@@ -81,24 +117,25 @@ class EnhancedLoggingMiddleware(BaseHTTPMiddleware):
                 extra={
                     **request_data,
                     "exception": str(exc),
-                    "duration_ms": (time.time() - start_time) * 1000
+                    "duration_ms": (time.monotonic_ns() - start_ns) / 1_000_000
                 }
             )
             raise
         
         # Prepare response log data
-        duration_ms = (time.time() - start_time) * 1000
+        status_code = response_info["status_code"]
+        duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
         response_data = {
             **request_data,
-            "status_code": response.status_code,
+            "status_code": status_code,
             "duration_ms": round(duration_ms, 2),
-            "response_size": response.headers.get("content-length")
+            "response_size": response_info["response_size"]
         }
         
         # Determine log level based on status code
-        if response.status_code >= 500:
+        if status_code >= 500:
             log_level = logging.ERROR
-        elif response.status_code >= 400:
+        elif status_code >= 400:
             log_level = logging.WARNING
         else:
             log_level = logging.INFO
@@ -106,29 +143,43 @@ class EnhancedLoggingMiddleware(BaseHTTPMiddleware):
         # Log the request/response
         logger.log(
             log_level,
-            f"{request.method} {request.url.path} - {response.status_code} - {duration_ms:.2f}ms",
+            f"{request.method} {request.url.path} - {status_code} - {duration_ms:.2f}ms",
             extra=response_data
         )
+    
+    @staticmethod
+    def _capture_body(receive: Receive, request_data: dict) -> Receive:
+        """
+        Wrap receive to record the body size and its first BODY_LOG_LIMIT bytes.
         
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
+        The body streams through to the endpoint untouched; only the logged
+        prefix is kept, and ``body_truncated`` marks bodies longer than it.
+        """
+        captured = bytearray()
+        total = 0
         
-        return response
+        async def wrapped_receive() -> Message:
+            nonlocal total
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                if chunk:
+                    total += len(chunk)
+                    request_data["body_size"] = total
+                    if total > BODY_LOG_LIMIT:
+                        request_data["body_truncated"] = True
+                    room = BODY_LOG_LIMIT - len(captured)
+                    if room > 0:
+                        captured.extend(chunk[:room])
+                if not message.get("more_body", False) and captured:
+                    request_data["body"] = captured.decode("utf-8", errors="ignore")
+            return message
+        
+        return wrapped_receive
     
     def _get_client_ip(self, request: Request) -> str:
         """Extract client IP address from request."""
-        # Check for forwarded headers (when behind proxy)
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-        
-        real_ip = request.headers.get("x-real-ip")
-        if real_ip:
-            return real_ip
-        
-        # Fallback to direct connection
-        if hasattr(request.client, "host"):
-            return request.client.host
-        
-        return "unknown"
+        return get_client_ip(request.scope)
 
+# Name used by main.py
+LoggingMiddleware = EnhancedLoggingMiddleware
@@ -1,61 +1,73 @@
 # backend/api/middleware/rate_limiting.py (Enhanced)
 import time
 import logging
-from typing import Dict, Optional
+from collections import deque
+from typing import Deque, Dict, Optional
 from fastapi import Request, HTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import redis.asyncio as redis
+from .client_ip import get_client_ip
 
 logger = logging.getLogger(__name__)
 
+# In-memory limiter drops idle clients after this many checks
+MEMORY_GC_INTERVAL = 1000
+
+# Rate-limit window, in seconds and in nanoseconds
+WINDOW_SECONDS = 60
+WINDOW_NS = WINDOW_SECONDS * 1_000_000_000
+
+# Fixed-window counter: one round trip, one integer key per client and window
+FIXED_WINDOW_LUA = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return count
+"""
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Rate limiting middleware with Redis backend."""
     
     def __init__(
         self,
         app,
-        redis_url: str = "redis://localhost:6379/0",
+        redis_client: Optional[redis.Redis] = None,
         requests_per_minute: int = 100,
         burst_requests: int = 20,
-        enable_rate_limiting: bool = True
+        enable_rate_limiting: bool = True,
+        redis_strategy: str = "fixed_window"
     ):
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
         self.burst_requests = burst_requests
         self.enable_rate_limiting = enable_rate_limiting
-        self.redis_client = None
-        self.redis_url = redis_url
+        # Explicit client; when None, the client the application published on
+        # app.state.redis at startup is used, and the in-memory limiter when
+        # that is None too (Redis was unreachable)
+        self.redis_client = redis_client
+        # "fixed_window" (INCR counter) or "sliding_window" (sorted set)
+        self.redis_strategy = redis_strategy
+        # Registering only hashes the script locally; it is loaded on first use
+        self._fixed_window_script = None
         
-        # Fallback in-memory storage
-        self.in_memory_storage: Dict[str, list] = {}
-    
-    async def connect_redis(self):
-        """Connect to Redis if available."""
-        try:
-            self.redis_client = redis.from_url(self.redis_url)
-            await self.redis_client.ping()
-            logger.info("Rate limiting using Redis backend")
-        except Exception as e:
-            logger.warning(f"Redis connection failed, using in-memory rate limiting: {e}")
-            self.redis_client = None
+        # Fallback in-memory storage: per-client request times (monotonic ns), oldest first
+        self.in_memory_storage: Dict[str, Deque[int]] = {}
+        self._checks_since_gc = 0
     
     async def dispatch(self, request: Request, call_next):
         if not self.enable_rate_limiting:
             return await call_next(request)
         
-        # Initialize Redis connection if needed
-        if self.redis_client is None and self.redis_url:
-            await self.connect_redis()
-        
         # Get client identifier
         client_id = self._get_client_id(request)
         
         # Check rate limit
-        allowed = await self._check_rate_limit(client_id)
+        allowed = await self._check_rate_limit(client_id, self._get_redis(request))
         
         if not allowed:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=429,
                 content={
                     "error": "rate_limit_exceeded",
@@ -80,64 +92,97 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return f"user:{request.state.user.id}"
         
         # Use IP address as fallback
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            ip = forwarded_for.split(",")[0].strip()
-        else:
-            ip = getattr(request.client, "host", "unknown")
-        
-        return f"ip:{ip}"
+        return f"ip:{get_client_ip(request.scope)}"
     
-    async def _check_rate_limit(self, client_id: str) -> bool:
+    def _get_redis(self, request: Request) -> Optional[redis.Redis]:
+        """Get the Redis client to use, or None for the in-memory limiter."""
+        if self.redis_client is not None:
+            return self.redis_client
+        return getattr(request.app.state, "redis", None)
+    
+    async def _check_rate_limit(self, client_id: str, redis_client: Optional[redis.Redis] = None) -> bool:
         """Check if request is within rate limit."""
-        current_time = time.time()
-        window_start = current_time - 60  # 1 minute window
-        
-        if self.redis_client:
-            return await self._check_rate_limit_redis(client_id, current_time, window_start)
+        # Redis state is shared between workers, so it needs wall-clock time;
+        # the in-memory limiter only compares against its own process clock
+        if redis_client is not None:
+            if self.redis_strategy == "sliding_window":
+                current_ns = time.time_ns()
+                return await self._check_rate_limit_redis_sliding(
+                    redis_client, client_id, current_ns, current_ns - WINDOW_NS
+                )
+            return await self._check_rate_limit_redis(redis_client, client_id, int(time.time()))
         else:
-            return await self._check_rate_limit_memory(client_id, current_time, window_start)
+            current_ns = time.monotonic_ns()
+            return await self._check_rate_limit_memory(client_id, current_ns, current_ns - WINDOW_NS)
     
-    async def _check_rate_limit_redis(self, client_id: str, current_time: float, window_start: float) -> bool:
-        """Redis-based rate limiting."""
+    async def _check_rate_limit_redis(self, redis_client: redis.Redis, client_id: str, current_time: int) -> bool:
+        """Redis fixed-window rate limiting (atomic INCR + EXPIRE)."""
         try:
-            key = f"rate_limit:{client_id}"
-            
-            # Remove old entries
-            await self.redis_client.zremrangebyscore(key, 0, window_start)
-            
-            # Count current requests
-            request_count = await self.redis_client.zcard(key)
+            script = self._fixed_window_script
+            if script is None or script.registered_client is not redis_client:
+                script = self._fixed_window_script = redis_client.register_script(FIXED_WINDOW_LUA)
+            window = current_time // WINDOW_SECONDS
+            count = await script(
+                keys=[f"rl:{client_id}:{window}"], args=[WINDOW_SECONDS]
+            )
+            return count <= self.requests_per_minute
             
-            if request_count >= self.requests_per_minute:
-                return False
+        except Exception as e:
+            logger.error(f"Redis rate limiting error: {e}")
+            # Fallback to allow request
+            return True
+    
+    async def _check_rate_limit_redis_sliding(
+        self, redis_client: redis.Redis, client_id: str, current_time: int, window_start: int
+    ) -> bool:
+        """Redis sliding-window rate limiting (sorted set of timestamps)."""
+        try:
+            key = f"rate_limit:{client_id}"
             
-            # Add current request
-            await self.redis_client.zadd(key, {str(current_time): current_time})
-            await self.redis_client.expire(key, 60)
+            # Trim, count, record and refresh the TTL in a single round trip;
+            # the count is taken before this request is added
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.zremrangebyscore(key, 0, window_start)
+                pipe.zcard(key)
+                pipe.zadd(key, {str(current_time): current_time})
+                pipe.expire(key, WINDOW_SECONDS)
+                _, request_count, _, _ = await pipe.execute()
             
-            return True
+            return request_count < self.requests_per_minute
             
         except Exception as e:
             logger.error(f"Redis rate limiting error: {e}")
             # Fallback to allow request
             return True
     
-    async def _check_rate_limit_memory(self, client_id: str, current_time: float, window_start: float) -> bool:
+    async def _check_rate_limit_memory(self, client_id: str, current_time: int, window_start: int) -> bool:
         """In-memory rate limiting."""
-        if client_id not in self.in_memory_storage:
-            self.in_memory_storage[client_id] = []
+        self._checks_since_gc += 1
+        if self._checks_since_gc >= MEMORY_GC_INTERVAL:
+            self._purge_idle_clients(window_start)
+        
+        timestamps = self.in_memory_storage.get(client_id)
+        if timestamps is None:
+            timestamps = self.in_memory_storage[client_id] = deque()
         
         # Clean old entries
-        self.in_memory_storage[client_id] = [
-            timestamp for timestamp in self.in_memory_storage[client_id]
-            if timestamp > window_start
-        ]
+        while timestamps and timestamps[0] <= window_start:
+            timestamps.popleft()
         
         # Check limit
-        if len(self.in_memory_storage[client_id]) >= self.requests_per_minute:
+        if len(timestamps) >= self.requests_per_minute:
             return False
         
         # Add current request
-        self.in_memory_storage[client_id].append(current_time)
+        timestamps.append(current_time)
         return True
+    
+    def _purge_idle_clients(self, window_start: int) -> None:
+        """Drop clients with no requests inside the current window."""
+        self._checks_since_gc = 0
+        idle = [
+            client_id for client_id, timestamps in self.in_memory_storage.items()
+            if not timestamps or timestamps[-1] <= window_start
+        ]
+        for client_id in idle:
+            del self.in_memory_storage[client_id]
@@ -1,52 +1,68 @@
 # backend/api/middleware/security.py
 import logging
-from typing import List, Optional
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from typing import List, Optional, Tuple
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to responses."""
+CONTENT_SECURITY_POLICY = (
+    b"default-src 'self'; "
+    b"script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
+    b"style-src 'self' 'unsafe-inline'; "
+    b"img-src 'self' data: https:; "
+    b"font-src 'self' https:; "
+    b"connect-src 'self' https: wss: ws:;"
+)
+
+HSTS_HEADER = (b"strict-transport-security", b"max-age=31536000; includeSubDomains")
+
+class SecurityHeadersMiddleware:
+    """Add security headers to responses (pure ASGI)."""
     
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         enable_hsts: bool = True,
         enable_csp: bool = True,
         enable_frame_options: bool = True,
         allowed_origins: Optional[List[str]] = None
     ):
-        super().__init__(app)
+        self.app = app
         self.enable_hsts = enable_hsts
         self.enable_csp = enable_csp
         self.enable_frame_options = enable_frame_options
         self.allowed_origins = allowed_origins or ["*"]
-    
-    async def dispatch(self, request: Request, call_next) -> Response:
-        response = await call_next(request)
         
-        # Add security headers
-        if self.enable_hsts and request.url.scheme == "https":
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        
-        if self.enable_csp:
-            response.headers["Content-Security-Policy"] = (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
-                "style-src 'self' 'unsafe-inline'; "
-                "img-src 'self' data: https:; "
-                "font-src 'self' https:; "
-                "connect-src 'self' https: wss: ws:;"
-            )
+        # Raw ASGI header pairs added to every response, built once
+        static_headers: List[Tuple[bytes, bytes]] = []
+        if enable_csp:
+            static_headers.append((b"content-security-policy", CONTENT_SECURITY_POLICY))
+        if enable_frame_options:
+            static_headers.append((b"x-frame-options", b"DENY"))
+        static_headers += [
+            (b"x-content-type-options", b"nosniff"),
+            (b"x-xss-protection", b"1; mode=block"),
+            (b"referrer-policy", b"strict-origin-when-cross-origin"),
+        ]
+        self._static_headers = static_headers
+        self._https_headers = static_headers + [HSTS_HEADER] if enable_hsts else static_headers
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        if self.enable_frame_options:
-            response.headers["X-Frame-Options"] = "DENY"
+        extra_headers = (
+            self._https_headers if scope.get("scheme") == "https" else self._static_headers
+        )
         
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = message.get("headers")
+                if isinstance(headers, list):
+                    headers.extend(extra_headers)
+                else:
+                    message["headers"] = [*(headers or ()), *extra_headers]
+            await send(message)
         
-        return response
-
+        await self.app(scope, receive, send_wrapper)
@@ -125,33 +125,72 @@ class WorkflowNodeResponse(WorkflowNodeBase):
         from_attributes = True
 
 # backend/api/services/auth_service.py
+import os
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
-from fastapi import HTTPException, status
+from uuid import UUID
+from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from passlib.context import CryptContext
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models.user import User
+from ..models.user import User, UserRole
 from ..schemas.user import UserCreate, UserResponse, Token
-from ..config.settings import settings
+from ..config.database import get_async_db
+from ..config.settings import get_settings
+from ..utils.auth_cache import AuthCache
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
+# Password hashing is CPU-bound and releases the GIL, so it runs on its own
+# pool (one thread per core) instead of blocking the event loop
+_HASH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash"
+)
+
+@dataclass(frozen=True, slots=True)
+class AuthenticatedUser:
+    """Session-independent snapshot of the user fields auth checks need."""
+    id: UUID
+    username: str
+    role: UserRole
+    is_active: bool
+
 class AuthService:
     def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        # New hashes use argon2id; bcrypt hashes still verify and are
+        # upgraded on the user's next login
+        self.pwd_context = CryptContext(
+            schemes=["argon2", "bcrypt"],
+            deprecated="auto",
+            argon2__type="ID",
+            argon2__time_cost=2,
+            argon2__memory_cost=65536,
+            argon2__parallelism=1,
+        )
         self.security = HTTPBearer()
+        # token -> decoded payload; user id -> AuthenticatedUser
+        self._cache = AuthCache()
     
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash."""
-        return self.pwd_context.verify(plain_password, hashed_password)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _HASH_EXECUTOR, self.pwd_context.verify, plain_password, hashed_password
+        )
     
-    def get_password_hash(self, password: str) -> str:
+    async def get_password_hash(self, password: str) -> str:
         """Hash a password."""
-        return self.pwd_context.hash(password)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_HASH_EXECUTOR, self.pwd_context.hash, password)
     
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """Create a JWT access token."""
@@ -166,36 +205,52 @@ class AuthService:
         return encoded_jwt
     
     def verify_token(self, token: str) -> dict:
-        """Verify and decode a JWT token."""
+        """Verify and decode a JWT token, reusing recent successful decodes."""
+        payload = self._cache.get_token(token)
+        if payload is not None:
+            return payload
+        
         try:
             payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
-            return payload
         except JWTError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        
+        self._cache.set_token(token, payload)
+        return payload
     
-    def authenticate_user(self, db: Session, username: str, password: str) -> Optional[User]:
+    async def authenticate_user(self, db: AsyncSession, username: str, password: str) -> Optional[User]:
         """Authenticate a user by username and password."""
-        user = db.query(User).filter(
-            (User.username == username) | (User.email == username)
-        ).first()
+        user = await db.scalar(
+            select(User).where(or_(User.username == username, User.email == username)).limit(1)
+        )
         
         if not user:
             return None
-        if not self.verify_password(password, user.password_hash):
+        
+        loop = asyncio.get_running_loop()
+        valid, new_hash = await loop.run_in_executor(
+            _HASH_EXECUTOR, self.pwd_context.verify_and_update, password, user.password_hash
+        )
+        if not valid:
             return None
+        if new_hash:
+            # Rehashed with the current scheme; committed with the login update
+            user.password_hash = new_hash
         
         return user
     
-    def create_user(self, db: Session, user_create: UserCreate) -> User:
+    async def create_user(self, db: AsyncSession, user_create: UserCreate) -> User:
         """Create a new user."""
         # Check if user already exists
-        existing_user = db.query(User).filter(
-            (User.email == user_create.email) | (User.username == user_create.username)
-        ).first()
+        existing_user = await db.scalar(
+            select(User.id).where(
+                or_(User.email == user_create.email, User.username == user_create.username)
+            ).limit(1)
+        )
         
         if existing_user:
             raise HTTPException(
@@ -204,7 +259,7 @@ class AuthService:
             )
         
         # Create new user
-        hashed_password = self.get_password_hash(user_create.password)
+        hashed_password = await self.get_password_hash(user_create.password)
         db_user = User(
             email=user_create.email,
             username=user_create.username,
@@ -214,19 +269,19 @@ class AuthService:
             role=user_create.role,
             is_active=user_create.is_active,
             avatar_url=user_create.avatar_url,
-            preferences=str(user_create.preferences) if user_create.preferences else "{}"
+            preferences=user_create.preferences or {}
         )
         
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
         
         logger.info(f"Created new user: {db_user.username}")
         return db_user
     
-    def login(self, db: Session, username: str, password: str) -> Token:
+    async def login(self, db: AsyncSession, username: str, password: str) -> Token:
         """Login user and return access token."""
-        user = self.authenticate_user(db, username, password)
+        user = await self.authenticate_user(db, username, password)
         
         if not user:
             raise HTTPException(
@@ -243,7 +298,8 @@ class AuthService:
         
         # Update last login
         user.last_login_at = datetime.utcnow()
-        db.commit()
+        await db.commit()
+        await db.refresh(user)
         
         # Create access token
         access_token_expires = timedelta(minutes=settings.jwt_expire_minutes)
@@ -258,8 +314,8 @@ class AuthService:
             user=UserResponse.from_orm(user)
         )
     
-    def get_current_user(self, db: Session, credentials: HTTPAuthorizationCredentials) -> User:
-        """Get current user from JWT token."""
+    def _get_user_id(self, credentials: HTTPAuthorizationCredentials) -> str:
+        """User ID (the ``sub`` claim) of a bearer token."""
         payload = self.verify_token(credentials.credentials)
         user_id: str = payload.get("sub")
         
@@ -270,7 +326,14 @@ class AuthService:
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        user = db.query(User).filter(User.id == user_id).first()
+        return user_id
+    
+    async def _load_user(self, db: AsyncSession, user_id: str) -> User:
+        """Fetch the user a token belongs to."""
+        try:
+            user = await db.get(User, UUID(user_id))
+        except ValueError:
+            user = None
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -278,6 +341,56 @@ class AuthService:
             )
         
         return user
+    
+    async def get_current_user(self, db: AsyncSession, credentials: HTTPAuthorizationCredentials) -> User:
+        """Get current user from JWT token."""
+        user = await self._load_user(db, self._get_user_id(credentials))
+        self._remember_user(user)
+        return user
+    
+    async def get_current_principal(self, db: AsyncSession, credentials: HTTPAuthorizationCredentials) -> AuthenticatedUser:
+        """
+        Get an AuthenticatedUser for the JWT token.
+        
+        Cheaper than get_current_user for routes that only need the user's
+        id or role: the database is only queried on a cache miss.
+        """
+        user_id = self._get_user_id(credentials)
+        principal = self._cache.get_user(user_id)
+        if principal is not None:
+            return principal
+        
+        return self._remember_user(await self._load_user(db, user_id))
+    
+    def _remember_user(self, user: User) -> AuthenticatedUser:
+        """Cache the auth snapshot of a freshly loaded user."""
+        principal = AuthenticatedUser(
+            id=user.id,
+            username=user.username,
+            role=user.role,
+            is_active=user.is_active
+        )
+        self._cache.set_user(user.id, principal)
+        return principal
+    
+    def invalidate_user(self, user_id) -> None:
+        """
+        Drop the cached snapshot of a user, e.g. after a role change or
+        deactivation. Other workers pick the change up once their entry expires.
+        """
+        self._cache.invalidate_user(user_id)
 
 # Global auth service instance
-auth_service = AuthService()
\ No newline at end of file
+auth_service = AuthService()
+
+async def get_current_principal_dep(
+    credentials: HTTPAuthorizationCredentials = Depends(auth_service.security),
+    db: AsyncSession = Depends(get_async_db)
+) -> AuthenticatedUser:
+    """
+    FastAPI dependency resolving the request's AuthenticatedUser.
+    
+    FastAPI runs it once per request and shares the database session with the
+    route, however many dependencies ask for the current user.
+    """
+    return await auth_service.get_current_principal(db, credentials)
\ No newline at end of file
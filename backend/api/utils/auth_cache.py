@@ -0,0 +1,63 @@
+# backend/api/utils/auth_cache.py
+import time
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Optional
+from cachetools import TTLCache
+
+# Decoded tokens and resolved users are reused for this long; a change to a
+# user is visible to other workers after at most this many seconds
+AUTH_CACHE_TTL_SECONDS = 60
+AUTH_CACHE_MAXSIZE = 10_000
+
+def token_key(token: str) -> bytes:
+    """Fixed-size cache key for a bearer token."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+class AuthCache:
+    """
+    Per-process TTL caches for decoded JWT payloads and user snapshots.
+
+    Tokens are keyed by a hash of the token, users by their id as a string.
+    A cached payload is only returned while its ``exp`` claim is in the future.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = AUTH_CACHE_MAXSIZE,
+        ttl: float = AUTH_CACHE_TTL_SECONDS,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        self._tokens = TTLCache(maxsize=maxsize, ttl=ttl, timer=timer)
+        self._users = TTLCache(maxsize=maxsize, ttl=ttl, timer=timer)
+        # TTLCache is not thread-safe and sync routes run in a thread pool
+        self._lock = threading.Lock()
+
+    def get_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """Cached payload of a token, or None if unknown or expired."""
+        with self._lock:
+            payload = self._tokens.get(token_key(token))
+        # A cached token can still expire before its cache entry does
+        if payload is not None and payload.get("exp", 0) > time.time():
+            return payload
+        return None
+
+    def set_token(self, token: str, payload: Dict[str, Any]) -> None:
+        """Remember the payload of a successfully verified token."""
+        with self._lock:
+            self._tokens[token_key(token)] = payload
+
+    def get_user(self, user_id: Any) -> Optional[Any]:
+        """Cached snapshot of a user, or None."""
+        with self._lock:
+            return self._users.get(str(user_id))
+
+    def set_user(self, user_id: Any, principal: Any) -> None:
+        """Remember the snapshot of a freshly loaded user."""
+        with self._lock:
+            self._users[str(user_id)] = principal
+
+    def invalidate_user(self, user_id: Any) -> None:
+        """Drop the cached snapshot of a user."""
+        with self._lock:
+            self._users.pop(str(user_id), None)
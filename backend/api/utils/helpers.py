@@ -0,0 +1,31 @@
+# backend/api/utils/helpers.py
+from collections.abc import Mapping
+from typing import Any, Iterable, List, Type
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+from sqlalchemy import Column, Table
+
+def response_columns(table: Table, model: Type[BaseModel]) -> List[Column]:
+    """Columns of ``table`` named by the fields of a response model, in field order."""
+    return [table.c[name] for name in model.model_fields]
+
+def _json_default(obj: Any) -> Any:
+    # Row mappings and lazily parsed JSON columns are mappings, not dicts
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def rows_response(rows: Iterable[Mapping], status_code: int = 200) -> Response:
+    """
+    Serialize database rows straight to a JSON array response.
+
+    Bypasses response-model validation, so only use it for rows selected with
+    response_columns() for the route's response_model.
+    """
+    return Response(
+        content=orjson.dumps(list(rows), default=_json_default, option=orjson.OPT_UTC_Z),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -1,3 +1,5 @@
+import asyncio
+import weakref
 import httpx
 from typing import Optional, List, Dict, Any, Union
 from .models import (
@@ -7,25 +9,98 @@ from .models import (
 from httpx._exceptions import HTTPError
 import logging
 
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:  # HTTP/2 needs the httpx[http2] extra
+    _HTTP2 = False
+
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by every MCPClient pointing at the same server from
+# the same event loop
+POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=50, max_connections=100, keepalive_expiry=30
+)
+CONNECT_TIMEOUT = 2.0
+
+# Pooled connections belong to the loop that opened them, so clients are kept
+# per running loop; a later asyncio.run() gets its own pool
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+def get_shared_client(base_url: str) -> httpx.AsyncClient:
+    """Return the running loop's pooled client for ``base_url``, creating it once.
+
+    Must be called from a coroutine.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _shared_clients.get(loop)
+    if clients is None:
+        # Open connections keep their loop alive, so drop pools of closed loops
+        for stale in [other for other in _shared_clients if other.is_closed()]:
+            del _shared_clients[stale]
+        clients = _shared_clients[loop] = {}
+    client = clients.get(base_url)
+    if client is None or client.is_closed:
+        client = clients[base_url] = httpx.AsyncClient(
+            base_url=base_url,
+            http2=_HTTP2,
+            limits=POOL_LIMITS,
+            headers={"Content-Type": "application/json"}
+        )
+    return client
+
+async def aclose_shared_clients() -> None:
+    """Close the running loop's pooled clients; call from the host's shutdown/lifespan.
+
+    MCPClient instances look up the pooled client on every request, so an
+    instance used after this call transparently gets a fresh pool.
+    """
+    clients = _shared_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
 class MCPClient:
-    """Client for interacting with the Model Context Protocol server."""
+    """Client for interacting with the Model Context Protocol server.
+
+    Instances share one connection pool per ``base_url`` and event loop. The
+    host closes the pool on shutdown with ``aclose_shared_clients()``, e.g. in a FastAPI
+    lifespan after the ``yield``.
+    """
     
-    def __init__(self, base_url: str = "http://localhost:8000", timeout: float = 30.0):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        timeout: float = 30.0,
+        client: Optional[httpx.AsyncClient] = None
+    ):
         """Initialize the client.
         
         Args:
             base_url: Base URL of the MCP server
             timeout: Request timeout in seconds
+            client: HTTP client to use instead of the shared pooled one
+                (e.g. in tests)
         """
         self.base_url = base_url
-        self.client = httpx.AsyncClient(
-            base_url=base_url,
-            timeout=timeout,
-            headers={"Content-Type": "application/json"}
-        )
+        self.timeout = httpx.Timeout(timeout, connect=CONNECT_TIMEOUT)
+        self._client = client
         self._token: Optional[str] = None
+        # Per-instance headers; the pooled client is shared between instances
+        self._headers: Dict[str, str] = {}
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client for the next request.
+
+        The shared client is looked up per call rather than stored, so a pool
+        closed by aclose_shared_clients() is never reused.
+        """
+        if self._client is not None:
+            return self._client
+        return get_shared_client(self.base_url)
     
     async def authenticate(self, token: str) -> None:
         """Set authentication token for requests.
@@ -34,7 +109,12 @@ class MCPClient:
             token: Authentication token
         """
         self._token = token
-        self.client.headers.update({"Authorization": f"Bearer {token}"})
+        self._headers = {"Authorization": f"Bearer {token}"}
+    
+    async def aclose(self) -> None:
+        """Close a client passed to the constructor; the shared pool is left open."""
+        if self._client is not None:
+            await self._client.aclose()
     
     async def create_context(
         self,
@@ -71,7 +151,8 @@ class MCPClient:
             response = await self.client.post(
                 "/contexts",
                 json=request.dict(),
-                timeout=30.0
+                headers=self._headers,
+                timeout=self.timeout
             )
             response.raise_for_status()
             return ContextResponse(**response.json())
@@ -117,7 +198,8 @@ class MCPClient:
             response = await self.client.get(
                 "/contexts",
                 params=query.dict(),
-                timeout=30.0
+                headers=self._headers,
+                timeout=self.timeout
             )
             response.raise_for_status()
             return [ContextResponse(**ctx) for ctx in response.json()]
@@ -140,7 +222,8 @@ class MCPClient:
         try:
             response = await self.client.get(
                 f"/contexts/{context_id}",
-                timeout=30.0
+                headers=self._headers,
+                timeout=self.timeout
             )
             response.raise_for_status()
             return ContextResponse(**response.json())
@@ -179,7 +262,8 @@ class MCPClient:
             response = await self.client.put(
                 f"/contexts/{context_id}",
                 json=update.dict(exclude_unset=True),
-                timeout=30.0
+                headers=self._headers,
+                timeout=self.timeout
             )
             response.raise_for_status()
             return ContextResponse(**response.json())
@@ -199,7 +283,8 @@ class MCPClient:
         try:
             response = await self.client.delete(
                 f"/contexts/{context_id}",
-                timeout=30.0
+                headers=self._headers,
+                timeout=self.timeout
             )
             response.raise_for_status()
         except HTTPError as e:
@@ -7,7 +7,7 @@ including creating, updating, and retrieving context during a conversation.
 
 import asyncio
 from datetime import datetime
-from mcp.client import MCPClient
+from mcp.client import MCPClient, aclose_shared_clients
 from typing import Dict, Any
 
 
@@ -151,6 +151,8 @@ async def main():
         # End conversation
         print("\nEnding conversation...")
         await agent.end_conversation()
+        # Release the pooled MCP connections before the event loop closes
+        await aclose_shared_clients()
 
 if __name__ == "__main__":
     asyncio.run(main())
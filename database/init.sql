@@ -318,6 +318,7 @@ CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
 CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
 CREATE INDEX IF NOT EXISTS idx_users_role ON users(role);
 CREATE INDEX IF NOT EXISTS idx_users_created_at ON users(created_at);
+CREATE INDEX IF NOT EXISTS idx_users_preferences ON users USING GIN(preferences jsonb_path_ops);
 
 -- Organizations indexes
 CREATE INDEX IF NOT EXISTS idx_organizations_slug ON organizations(slug);
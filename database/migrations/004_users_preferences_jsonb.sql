@@ -0,0 +1,23 @@
+-- Store users.preferences as JSONB so flags can be filtered server-side
+-- (e.g. preferences @> '{"theme": "dark"}') and indexed with GIN.
+-- ALTER ... TYPE rewrites the whole table under an ACCESS EXCLUSIVE lock even
+-- when the type is unchanged, so the conversion only runs if the column is not
+-- JSONB yet; on databases created from init.sql only the index is added.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'users'
+          AND column_name = 'preferences'
+          AND data_type <> 'jsonb'
+    ) THEN
+        ALTER TABLE users
+            ALTER COLUMN preferences TYPE JSONB USING COALESCE(NULLIF(preferences::text, ''), '{}')::jsonb,
+            ALTER COLUMN preferences SET DEFAULT '{}';
+    END IF;
+END
+$$;
+
+CREATE INDEX IF NOT EXISTS idx_users_preferences ON users USING GIN(preferences jsonb_path_ops);
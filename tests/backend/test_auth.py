@@ -0,0 +1,135 @@
+"""
+Test Auth
+=========
+
+Tests for the JWT payload and user snapshot caches used by AuthService.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from jose import jwt
+
+from utils.auth_cache import AuthCache, token_key
+
+SECRET = "test-secret-key-for-auth-cache-tests"
+
+
+class FakeTimer:
+    """Manually advanced clock for TTL expiry."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _token(exp_offset=3600, **claims):
+    payload = {"sub": str(uuid4()), "exp": int(time.time()) + exp_offset, **claims}
+    return jwt.encode(payload, SECRET, algorithm="HS256"), payload
+
+
+def test_token_key_is_fixed_size():
+    """Test that long tokens map to short, distinct keys."""
+    token_a, _ = _token(scope="a" * 1000)
+    token_b, _ = _token(scope="b" * 1000)
+
+    assert len(token_key(token_a)) == 16
+    assert token_key(token_a) == token_key(token_a)
+    assert token_key(token_a) != token_key(token_b)
+
+
+def test_token_cache_hit():
+    """Test that a verified payload is returned for the same token."""
+    cache = AuthCache()
+    token, payload = _token()
+
+    assert cache.get_token(token) is None
+    cache.set_token(token, payload)
+    assert cache.get_token(token) == payload
+
+    other, _ = _token()
+    assert cache.get_token(other) is None
+
+
+def test_token_cache_respects_exp():
+    """Test that a cached payload is not reused once the token has expired."""
+    cache = AuthCache()
+    token, payload = _token(exp_offset=-1)
+
+    cache.set_token(token, payload)
+    assert cache.get_token(token) is None
+
+
+def test_token_cache_requires_exp():
+    """Test that payloads without an exp claim are never served from cache."""
+    cache = AuthCache()
+    cache.set_token("token", {"sub": "user"})
+    assert cache.get_token("token") is None
+
+
+def test_token_cache_ttl():
+    """Test that entries are dropped after the cache TTL."""
+    timer = FakeTimer()
+    cache = AuthCache(ttl=60, timer=timer)
+    token, payload = _token()
+    cache.set_token(token, payload)
+
+    timer.now = 59
+    assert cache.get_token(token) == payload
+    timer.now = 61
+    assert cache.get_token(token) is None
+
+
+def test_user_cache_set_get_invalidate():
+    """Test storing, reading and invalidating a user snapshot."""
+    cache = AuthCache()
+    user_id = uuid4()
+    principal = object()
+
+    cache.set_user(user_id, principal)
+    # Token subjects are strings; both spellings hit the same entry
+    assert cache.get_user(str(user_id)) is principal
+    assert cache.get_user(user_id) is principal
+
+    cache.invalidate_user(str(user_id))
+    assert cache.get_user(user_id) is None
+    cache.invalidate_user(user_id)
+
+
+def test_user_cache_ttl():
+    """Test that user snapshots expire after the cache TTL."""
+    timer = FakeTimer()
+    cache = AuthCache(ttl=60, timer=timer)
+    cache.set_user("user", "principal")
+
+    timer.now = 61
+    assert cache.get_user("user") is None
+
+
+def test_cache_maxsize():
+    """Test that the caches stay bounded."""
+    cache = AuthCache(maxsize=2)
+    for i in range(5):
+        cache.set_user(i, i)
+
+    assert sum(cache.get_user(i) is not None for i in range(5)) == 2
+    assert cache.get_user(4) == 4
+
+
+def test_cache_concurrent_access():
+    """Test that concurrent readers and writers from the thread pool are safe."""
+    cache = AuthCache(maxsize=64)
+    tokens = [_token() for _ in range(32)]
+
+    def work(i):
+        token, payload = tokens[i % len(tokens)]
+        cache.set_token(token, payload)
+        cache.set_user(i, i)
+        cached = cache.get_token(token)
+        return cached is None or cached == payload
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(work, range(2000)))
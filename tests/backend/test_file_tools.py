@@ -0,0 +1,293 @@
+"""
+Test File Tools
+===============
+
+Tests for the agent-engine FileTools path and stat caches.
+"""
+
+import json
+import os
+import random
+import tarfile
+import time
+import zipfile
+
+import pytest
+
+from tools import file_tools
+from tools.file_tools import FileError, FileTools
+
+
+@pytest.fixture
+def ft(tmp_path, monkeypatch):
+    """FileTools working inside a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    return FileTools(base_dir=str(tmp_path))
+
+
+def _write_json(ft, path):
+    ft.write_json_file({"key": "a much longer value than before"}, path)
+
+
+def _write_yaml(ft, path):
+    ft.write_yaml_file({"key": "a much longer value than before"}, path)
+
+
+def _write_csv(ft, path):
+    ft.write_csv_file([{"key": "a much longer value than before"}], path)
+
+
+def _zip(ft, path):
+    os.makedirs("src", exist_ok=True)
+    with open("src/data.txt", "w") as f:
+        f.write("x" * 4096)
+    ft.zip_directory("src", path, compression=zipfile.ZIP_STORED)
+
+
+def _tarball(ft, path):
+    os.makedirs("src", exist_ok=True)
+    with open("src/data.txt", "w") as f:
+        f.write("x" * 4096)
+    ft.create_tarball("src", path)
+
+
+@pytest.mark.parametrize("write", [_write_json, _write_yaml, _write_csv, _zip, _tarball])
+def test_writes_invalidate_cached_size(ft, write):
+    """Test that every write path refreshes the cached stat result."""
+    with open("out", "w") as f:
+        f.write("{}")
+    assert ft.get_file_size("out") == 2
+
+    write(ft, "out")
+    assert ft.get_file_size("out") == os.path.getsize("out")
+    assert ft.get_file_size("out") > 2
+
+
+@pytest.mark.asyncio
+async def test_async_write_invalidates_cached_size(ft):
+    """Test that async writes refresh the cached stat result."""
+    with open("out.txt", "w") as f:
+        f.write("a")
+    assert ft.get_file_size("out.txt") == 1
+
+    await ft.async_write_file("abc", "out.txt")
+    assert ft.get_file_size("out.txt") == 3
+
+
+def test_equivalent_paths_share_entries(ft, tmp_path):
+    """Test that relative, dotted and absolute spellings hit the same entry."""
+    with open("a.txt", "w") as f:
+        f.write("a")
+    assert ft.get_file_size("a.txt") == 1
+    assert ft.get_file_size("./a.txt") == 1
+
+    ft.atomic_write_file("abcd", tmp_path / "a.txt")
+    assert ft.get_file_size("a.txt") == 4
+    assert ft.get_file_size("./a.txt") == 4
+
+
+def test_delete_file_invalidates_validate_path(ft):
+    """Test that a deleted file no longer validates."""
+    with open("a.txt", "w") as f:
+        f.write("a")
+    ft.validate_path("a.txt")
+
+    ft.delete_file("./a.txt")
+    with pytest.raises(ValueError):
+        ft.validate_path("a.txt")
+
+
+def test_delete_directory_invalidates_children(ft):
+    """Test that deleting a directory drops cached entries below it."""
+    os.makedirs("d/sub")
+    with open("d/sub/a.txt", "w") as f:
+        f.write("a")
+    ft.validate_path("d/sub/a.txt")
+    ft.get_file_size("d/sub/a.txt")
+
+    ft.delete_directory("d")
+    with pytest.raises(ValueError):
+        ft.validate_path("d/sub/a.txt")
+
+
+def test_move_directory_invalidates_children(ft):
+    """Test that moving a directory drops cached entries for its old children."""
+    os.makedirs("d")
+    with open("d/a.txt", "w") as f:
+        f.write("a")
+    ft.validate_path("d/a.txt")
+
+    ft.move_file("d", "e")
+    with pytest.raises(ValueError):
+        ft.validate_path("d/a.txt")
+    assert ft.get_file_size("e/a.txt") == 1
+
+
+def test_extract_invalidates_output_dir(ft):
+    """Test that extracting archives refreshes entries inside the output directory."""
+    os.makedirs("src")
+    with open("src/a.txt", "w") as f:
+        f.write("new contents")
+    with zipfile.ZipFile("a.zip", "w") as zipf:
+        zipf.write("src/a.txt", "a.txt")
+    with tarfile.open("a.tar.gz", "w:gz") as tar:
+        tar.add("src", arcname="src")
+
+    os.makedirs("out/src")
+    for name in ("out/a.txt", "out/src/a.txt"):
+        with open(name, "w") as f:
+            f.write("old")
+        assert ft.get_file_size(name) == 3
+
+    ft.unzip_file("a.zip", "out")
+    assert ft.get_file_size("out/a.txt") == 12
+
+    ft.extract_tarball("a.tar.gz", "out")
+    assert ft.get_file_size("out/src/a.txt") == 12
+
+
+def test_external_changes_visible_after_ttl(tmp_path, monkeypatch):
+    """Test that changes made behind the instance's back are seen once entries expire."""
+    monkeypatch.chdir(tmp_path)
+    ft = FileTools(base_dir=str(tmp_path), cache_ttl=0.05)
+    with open("a.txt", "w") as f:
+        f.write("a")
+    assert ft.get_file_size("a.txt") == 1
+    ft.validate_path("a.txt")
+
+    with open("a.txt", "w") as f:
+        f.write("abc")
+    time.sleep(0.1)
+    assert ft.get_file_size("a.txt") == 3
+
+    os.remove("a.txt")
+    time.sleep(0.1)
+    with pytest.raises(ValueError):
+        ft.validate_path("a.txt")
+
+
+def test_zero_ttl_disables_caching(tmp_path, monkeypatch):
+    """Test that cache_ttl=0 always returns fresh results."""
+    monkeypatch.chdir(tmp_path)
+    ft = FileTools(base_dir=str(tmp_path), cache_ttl=0)
+    with open("a.txt", "w") as f:
+        f.write("a")
+    assert ft.get_file_size("a.txt") == 1
+
+    with open("a.txt", "w") as f:
+        f.write("abc")
+    assert ft.get_file_size("a.txt") == 3
+
+
+def test_invalidate_cache_refreshes_immediately(ft):
+    """Test that invalidate_cache() drops an entry before it expires."""
+    with open("a.txt", "w") as f:
+        f.write("a")
+    assert ft.get_file_size("a.txt") == 1
+
+    with open("a.txt", "w") as f:
+        f.write("abc")
+    ft.invalidate_cache("a.txt")
+    assert ft.get_file_size("a.txt") == 3
+
+
+def test_zip_directory_compresslevel(ft):
+    """Test that zip_directory round-trips files and honours compresslevel."""
+    os.makedirs("src/sub")
+    rng = random.Random(0)
+    text = " ".join(rng.choice(["alpha", "beta", "gamma", "delta"]) for _ in range(50000))
+    with open("src/a.txt", "w") as f:
+        f.write(text)
+    with open("src/sub/b.txt", "w") as f:
+        f.write("b")
+
+    ft.zip_directory("src", "fast.zip")
+    ft.zip_directory("src", "small.zip", compresslevel=9)
+
+    with zipfile.ZipFile("fast.zip") as zipf:
+        assert sorted(zipf.namelist()) == ["a.txt", "sub/b.txt"]
+        assert zipf.read("a.txt").decode() == text
+        assert zipf.getinfo("a.txt").compress_type == zipfile.ZIP_DEFLATED
+        fast = zipf.getinfo("a.txt").compress_size
+    with zipfile.ZipFile("small.zip") as zipf:
+        small = zipf.getinfo("a.txt").compress_size
+
+    assert small < fast < len(text)
+
+
+def test_zip_directory_streams_in_copy_buffer_chunks(ft, monkeypatch):
+    """Test that file data is copied with the 1 MiB copy buffer."""
+    os.makedirs("src")
+    with open("src/a.txt", "w") as f:
+        f.write("a" * 100)
+
+    lengths = []
+    real_copyfileobj = file_tools.shutil.copyfileobj
+
+    def copyfileobj(src, dst, length=0):
+        lengths.append(length)
+        return real_copyfileobj(src, dst, length)
+
+    monkeypatch.setattr(file_tools.shutil, "copyfileobj", copyfileobj)
+    ft.zip_directory("src", "out.zip", compresslevel=9)
+
+    assert lengths == [file_tools.COPY_BUFFER_SIZE]
+    with zipfile.ZipFile("out.zip") as zipf:
+        assert zipf.read("a.txt") == b"a" * 100
+        assert zipf.getinfo("a.txt").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_copy_file_onto_itself(ft):
+    """Test that copying a file onto itself fails without truncating it."""
+    with open("a.txt", "w") as f:
+        f.write("abc")
+
+    with pytest.raises(FileError):
+        ft.copy_file("a.txt", "a.txt")
+    with pytest.raises(FileError):
+        ft.copy_file("a.txt", "./a.txt")
+    assert os.path.getsize("a.txt") == 3
+
+
+def test_copy_file_onto_symlink_to_source(ft):
+    """Test that copying onto a symlink that points at the source fails."""
+    with open("a.txt", "w") as f:
+        f.write("abc")
+    os.symlink("a.txt", "link.txt")
+
+    with pytest.raises(FileError):
+        ft.copy_file("a.txt", "link.txt")
+    assert os.path.getsize("a.txt") == 3
+
+
+@pytest.fixture
+def simd_json(monkeypatch):
+    """Route every keyed read_json_file call through the simdjson parser."""
+    pytest.importorskip("simdjson")
+    monkeypatch.setattr(file_tools, "SIMDJSON_MIN_BYTES", 0)
+
+
+def test_simdjson_non_object_with_keys(ft, simd_json):
+    """Test that selecting keys from a top-level array raises FileError."""
+    with open("arr.json", "w") as f:
+        json.dump([1, 2, 3], f)
+    with open("obj.json", "w") as f:
+        json.dump({"a": [1, 2], "b": {"c": None}}, f)
+
+    with pytest.raises(FileError) as excinfo:
+        ft.read_json_file("arr.json", keys=["a"])
+
+    # The kept traceback must not pin the document to this thread's parser
+    assert excinfo.value is not None
+    assert ft.read_json_file("obj.json", keys=["a", "b", "x"]) == {"a": [1, 2], "b": {"c": None}}
+
+
+@pytest.mark.parametrize("document", [[1, 2, 3], "text", 1, None])
+def test_keys_from_non_object_raise(ft, document):
+    """Test that small files, read without simdjson, also reject non-object documents."""
+    with open("doc.json", "w") as f:
+        json.dump(document, f)
+
+    with pytest.raises(FileError):
+        ft.read_json_file("doc.json", keys=["a"])
+    assert ft.read_json_file("doc.json") == document
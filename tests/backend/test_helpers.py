@@ -0,0 +1,174 @@
+"""
+Test Helpers
+============
+
+Tests for the API response helpers.
+
+rows_response() skips response_model validation, so its output must match
+what FastAPI would produce for the route's declared response_model.
+"""
+
+import enum
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+
+import httpx
+import orjson
+import pytest
+from fastapi import FastAPI
+from pydantic import BaseModel
+from sqlalchemy import Column, Integer, MetaData, String, Table
+
+from utils.helpers import response_columns, rows_response
+
+
+class WorkflowStatus(str, enum.Enum):
+    DRAFT = "draft"
+    ACTIVE = "active"
+
+
+# Same field types as schemas.user.WorkflowResponse, which cannot be
+# imported on its own
+class WorkflowResponse(BaseModel):
+    name: str
+    description: Optional[str] = None
+    status: WorkflowStatus = WorkflowStatus.DRAFT
+    definition: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = {}
+    is_template: bool = False
+    tags: List[str] = []
+    category: Optional[str] = None
+    id: UUID
+    organization_id: Optional[UUID]
+    created_by: UUID
+    version: int
+    execution_count: int
+    success_count: int
+    failure_count: int
+    last_executed_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+    published_at: Optional[datetime]
+
+
+def _workflow_row(**overrides):
+    """A row as the async driver returns it: UUIDs, aware datetimes, enum members."""
+    row = {
+        "name": "Ingest",
+        "description": None,
+        "status": WorkflowStatus.ACTIVE,
+        # LazyJsonView columns are read-only mappings, not dicts
+        "definition": MappingProxyType({"nodes": [{"id": "n1", "x": 1.5}], "edges": []}),
+        "metadata": MappingProxyType({}),
+        "is_template": False,
+        "tags": ["etl", "nightly"],
+        "category": "data",
+        "id": uuid4(),
+        "organization_id": None,
+        "created_by": uuid4(),
+        "version": 3,
+        "execution_count": 10,
+        "success_count": 9,
+        "failure_count": 1,
+        "last_executed_at": datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "updated_at": datetime(2024, 4, 30, 8, 0, 0, 500000, tzinfo=timezone.utc),
+        "published_at": None,
+    }
+    row.update(overrides)
+    return row
+
+
+def _app(rows):
+    app = FastAPI()
+
+    @app.get("/validated", response_model=List[WorkflowResponse])
+    async def validated():
+        return [
+            dict(row, definition=dict(row["definition"]), metadata=dict(row["metadata"]))
+            for row in rows
+        ]
+
+    @app.get("/rows", response_model=List[WorkflowResponse])
+    async def fast():
+        return rows_response(rows)
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_rows_response_matches_response_model():
+    """Test that rows_response emits the same JSON as response_model serialization."""
+    rows = [_workflow_row(), _workflow_row(name="Report", tags=[], category=None)]
+
+    async with httpx.AsyncClient(app=_app(rows), base_url="http://test") as client:
+        validated = await client.get("/validated")
+        fast = await client.get("/rows")
+
+    assert fast.status_code == validated.status_code == 200
+    assert fast.headers["content-type"] == "application/json"
+    assert fast.json() == validated.json()
+    assert fast.content == validated.content
+
+
+def test_rows_response_body():
+    """Test the serialized form of the types rows carry."""
+    row = _workflow_row()
+    body = orjson.loads(rows_response([row]).body)[0]
+
+    assert body["id"] == str(row["id"])
+    assert body["status"] == "active"
+    assert body["definition"] == {"nodes": [{"id": "n1", "x": 1.5}], "edges": []}
+    assert body["last_executed_at"] == "2024-05-01T12:30:15.123456Z"
+    assert body["created_at"] == "2024-01-01T00:00:00Z"
+    assert body["published_at"] is None
+    assert list(body) == list(WorkflowResponse.model_fields)
+
+
+def test_rows_response_validates_against_model():
+    """Test that the body parses back into the response model."""
+    rows = [_workflow_row(), _workflow_row()]
+    parsed = [WorkflowResponse.model_validate(item) for item in orjson.loads(rows_response(rows).body)]
+
+    assert [item.id for item in parsed] == [row["id"] for row in rows]
+
+
+def test_rows_response_empty_and_status():
+    """Test an empty page and a custom status code."""
+    response = rows_response([], status_code=206)
+    assert response.status_code == 206
+    assert response.body == b"[]"
+
+
+def test_rows_response_rejects_unknown_types():
+    """Test that values orjson cannot encode are not silently stringified."""
+    with pytest.raises(TypeError):
+        rows_response([{"value": object()}])
+
+
+def test_response_columns_follow_model_fields():
+    """Test that columns are selected by response field name, in field order."""
+    class Out(BaseModel):
+        name: str
+        id: int
+
+    table = Table(
+        "things", MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("secret", String),
+        Column("name", String),
+    )
+
+    assert [column.name for column in response_columns(table, Out)] == ["name", "id"]
+
+
+def test_response_columns_missing_column():
+    """Test that a response field without a column fails loudly."""
+    class Out(BaseModel):
+        missing: str
+
+    table = Table("others", MetaData(), Column("id", Integer, primary_key=True))
+    with pytest.raises(KeyError):
+        response_columns(table, Out)
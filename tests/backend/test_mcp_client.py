@@ -0,0 +1,138 @@
+"""
+Test MCP Client
+===============
+
+Tests for the pooled HTTP client shared by MCPClient instances.
+"""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from mcp import client as mcp_client
+from mcp.client import MCPClient, aclose_shared_clients, get_shared_client
+
+BASE_URL = "http://mcp.test"
+
+
+def _install_mock_client(seen):
+    """Make the shared client for BASE_URL record requests into ``seen``."""
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(204)
+
+    clients = mcp_client._shared_clients.setdefault(asyncio.get_running_loop(), {})
+    clients[BASE_URL] = httpx.AsyncClient(
+        base_url=BASE_URL, transport=httpx.MockTransport(handler)
+    )
+
+
+@pytest_asyncio.fixture
+async def requests():
+    """Requests sent through a mock-transport shared client."""
+    seen = []
+    _install_mock_client(seen)
+    yield seen
+    await aclose_shared_clients()
+
+
+@pytest.mark.asyncio
+async def test_instances_share_one_client(requests):
+    """Test that instances for the same server reuse one pooled client."""
+    first, second = MCPClient(base_url=BASE_URL), MCPClient(base_url=BASE_URL)
+
+    assert first.client is second.client is get_shared_client(BASE_URL)
+
+
+@pytest.mark.asyncio
+async def test_headers_are_per_instance(requests):
+    """Test that one instance's token is not sent by another."""
+    authed, anonymous = MCPClient(base_url=BASE_URL), MCPClient(base_url=BASE_URL)
+    await authed.authenticate("secret")
+
+    await authed.delete_context("a")
+    await anonymous.delete_context("b")
+
+    assert requests[0].headers["Authorization"] == "Bearer secret"
+    assert "Authorization" not in requests[1].headers
+
+
+@pytest.mark.asyncio
+async def test_instance_survives_aclose_shared_clients(requests):
+    """Test that an instance keeps working after the shared pool is closed."""
+    client = MCPClient(base_url=BASE_URL)
+    await client.delete_context("a")
+    old = client.client
+
+    await aclose_shared_clients()
+    assert old.is_closed
+
+    _install_mock_client(requests)
+    await client.delete_context("b")
+    assert client.client is not old
+    assert [r.url.path for r in requests] == ["/contexts/a", "/contexts/b"]
+
+
+@pytest.mark.asyncio
+async def test_closed_shared_client_is_recreated():
+    """Test that a closed pooled client is replaced on the next lookup."""
+    old = get_shared_client(BASE_URL)
+    await old.aclose()
+
+    new = MCPClient(base_url=BASE_URL).client
+    assert new is not old
+    assert not new.is_closed
+    await aclose_shared_clients()
+
+
+@pytest.mark.asyncio
+async def test_aclose_leaves_shared_client_open(requests):
+    """Test that closing an instance only closes a client it was given."""
+    shared = MCPClient(base_url=BASE_URL)
+    await shared.aclose()
+    assert not shared.client.is_closed
+
+    own = httpx.AsyncClient(base_url=BASE_URL)
+    await MCPClient(base_url=BASE_URL, client=own).aclose()
+    assert own.is_closed
+
+
+class _NoContentHandler(BaseHTTPRequestHandler):
+    """Keep-alive HTTP/1.1 handler answering every DELETE with 204."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_DELETE(self):
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    """URL of a real HTTP server running in a background thread."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _NoContentHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_consecutive_event_loops(server_url):
+    """Test that separate asyncio.run() calls each get a working pool."""
+    async def delete(context_id):
+        client = MCPClient(base_url=server_url)
+        await client.delete_context(context_id)
+        return client.client
+
+    first = asyncio.run(delete("a"))
+    second = asyncio.run(delete("b"))
+
+    assert first is not second
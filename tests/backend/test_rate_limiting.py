@@ -0,0 +1,203 @@
+"""
+Test Rate Limiting
+==================
+
+Tests for the API rate limiting middleware.
+
+The Redis cases run against REDIS_URL and are skipped when it is unreachable.
+"""
+
+import os
+from uuid import uuid4
+
+import httpx
+import pytest
+import pytest_asyncio
+import redis.asyncio as redis
+from fastapi import FastAPI
+
+from middleware.rate_llimiting import (
+    MEMORY_GC_INTERVAL,
+    WINDOW_NS,
+    WINDOW_SECONDS,
+    RateLimitMiddleware,
+)
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+LIMIT = 3
+
+
+def _make_app(**options):
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, requests_per_minute=LIMIT, **options)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def _hit(app, ip, times):
+    """Send ``times`` requests from ``ip`` and return the responses."""
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        responses = [
+            await client.get("/ping", headers={"X-Forwarded-For": ip})
+            for _ in range(times)
+        ]
+    return responses
+
+
+def _unique_ip():
+    """Client address that no other test run shares a Redis key with."""
+    return f"test-{uuid4().hex}"
+
+
+@pytest_asyncio.fixture
+async def redis_client():
+    """Redis client for REDIS_URL; skips the test when Redis is unreachable."""
+    client = redis.from_url(REDIS_URL)
+    try:
+        await client.ping()
+    except (redis.ConnectionError, OSError):
+        await client.aclose()
+        pytest.skip("Redis is not available")
+    yield client
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_memory_limit_exceeded():
+    """Test that the in-memory limiter rejects requests over the limit."""
+    responses = await _hit(_make_app(), "192.0.2.1", LIMIT + 1)
+
+    assert [r.status_code for r in responses] == [200] * LIMIT + [429]
+    rejected = responses[-1]
+    assert rejected.json()["error"] == "rate_limit_exceeded"
+    assert rejected.headers["Retry-After"] == "60"
+    assert rejected.headers["X-RateLimit-Limit"] == str(LIMIT)
+    assert rejected.headers["X-RateLimit-Remaining"] == "0"
+
+
+@pytest.mark.asyncio
+async def test_memory_limit_is_per_client():
+    """Test that clients are limited independently."""
+    app = _make_app()
+    await _hit(app, "192.0.2.1", LIMIT)
+
+    responses = await _hit(app, "192.0.2.2", 1)
+    assert responses[0].status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_disabled_rate_limiting():
+    """Test that rate limiting can be switched off."""
+    responses = await _hit(_make_app(enable_rate_limiting=False), "192.0.2.1", LIMIT + 2)
+    assert all(r.status_code == 200 for r in responses)
+
+
+@pytest.mark.asyncio
+async def test_memory_window_expires():
+    """Test that requests older than the window no longer count."""
+    limiter = RateLimitMiddleware(None, requests_per_minute=2)
+
+    for now in (0, 1):
+        assert await limiter._check_rate_limit_memory("c", now, now - WINDOW_NS)
+    assert not await limiter._check_rate_limit_memory("c", 2, 2 - WINDOW_NS)
+
+    later = WINDOW_NS + 1
+    assert await limiter._check_rate_limit_memory("c", later, later - WINDOW_NS)
+
+
+@pytest.mark.asyncio
+async def test_memory_purges_idle_clients():
+    """Test that clients idle for a whole window are dropped periodically."""
+    limiter = RateLimitMiddleware(None, requests_per_minute=10)
+    await limiter._check_rate_limit_memory("idle", 0, -WINDOW_NS)
+
+    now = 2 * WINDOW_NS
+    for i in range(MEMORY_GC_INTERVAL):
+        await limiter._check_rate_limit_memory(f"active-{i % 5}", now, now - WINDOW_NS)
+
+    assert "idle" not in limiter.in_memory_storage
+    assert "active-0" in limiter.in_memory_storage
+
+
+@pytest.mark.asyncio
+async def test_app_state_without_redis_uses_memory():
+    """Test that a None app.state.redis (Redis down at startup) keeps limiting."""
+    app = _make_app()
+    app.state.redis = None
+
+    responses = await _hit(app, "192.0.2.1", LIMIT + 1)
+    assert responses[-1].status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_redis_client_from_app_state(redis_client):
+    """Test that the client published on app.state.redis at startup is used."""
+    app = _make_app()
+    app.state.redis = redis_client
+    ip = _unique_ip()
+
+    responses = await _hit(app, ip, LIMIT + 1)
+    assert responses[-1].status_code == 429
+
+    keys = [key async for key in redis_client.scan_iter(match=f"rl:ip:{ip}:*")]
+    assert len(keys) == 1
+    await redis_client.delete(*keys)
+
+
+@pytest.mark.asyncio
+async def test_redis_fixed_window(redis_client):
+    """Test that the Redis fixed window rejects requests over the limit."""
+    app = _make_app(redis_client=redis_client)
+    ip = _unique_ip()
+
+    responses = await _hit(app, ip, LIMIT + 1)
+    assert [r.status_code for r in responses] == [200] * LIMIT + [429]
+
+    keys = [key async for key in redis_client.scan_iter(match=f"rl:ip:{ip}:*")]
+    assert len(keys) == 1
+    assert int(await redis_client.get(keys[0])) == LIMIT + 1
+    assert 0 < await redis_client.ttl(keys[0]) <= WINDOW_SECONDS
+    await redis_client.delete(*keys)
+
+
+@pytest.mark.asyncio
+async def test_redis_sliding_window(redis_client):
+    """Test that the pipelined sorted-set window rejects requests over the limit."""
+    app = _make_app(redis_client=redis_client, redis_strategy="sliding_window")
+    ip = _unique_ip()
+
+    responses = await _hit(app, ip, LIMIT + 1)
+    assert [r.status_code for r in responses] == [200] * LIMIT + [429]
+
+    key = f"rate_limit:ip:{ip}"
+    assert await redis_client.zcard(key) == LIMIT + 1
+    assert 0 < await redis_client.ttl(key) <= WINDOW_SECONDS
+    await redis_client.delete(key)
+
+
+@pytest.mark.asyncio
+async def test_redis_sliding_window_trims_old_entries(redis_client):
+    """Test that entries older than the window are trimmed before counting."""
+    limiter = RateLimitMiddleware(None, redis_client=redis_client, requests_per_minute=1)
+    client_id = f"ip:{_unique_ip()}"
+
+    assert await limiter._check_rate_limit_redis_sliding(redis_client, client_id, 1, 1 - WINDOW_NS)
+    assert not await limiter._check_rate_limit_redis_sliding(redis_client, client_id, 2, 2 - WINDOW_NS)
+
+    later = WINDOW_NS + 3
+    assert await limiter._check_rate_limit_redis_sliding(redis_client, client_id, later, later - WINDOW_NS)
+    await redis_client.delete(f"rate_limit:{client_id}")
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fail_open():
+    """Test that Redis errors during a request let the request through."""
+    client = redis.Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.1)
+    responses = await _hit(_make_app(redis_client=client), "192.0.2.1", LIMIT + 1)
+    await client.aclose()
+
+    assert all(r.status_code == 200 for r in responses)
@@ -0,0 +1,82 @@
+"""
+Test Web Tools
+==============
+
+Tests for the agent-engine WebTools response caches.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from tools.web_tools import WebTools
+
+
+@pytest.fixture
+def cached_call():
+    """A cache_response-wrapped function that records its real invocations."""
+    calls = []
+    wt = WebTools()
+
+    @wt.cache_response
+    def call(*args, **kwargs):
+        calls.append((args, kwargs))
+        return len(calls)
+
+    call.calls = calls
+    return call
+
+
+@pytest.mark.parametrize("first, second", [
+    ((1, 2), [1, 2]),
+    (Decimal("1"), "1"),
+    ({"a": 1}, {"a": "1"}),
+])
+def test_cache_keys_keep_argument_types_apart(cached_call, first, second):
+    """Test that arguments differing only in type get separate entries."""
+    assert cached_call(first) == 1
+    assert cached_call(second) == 2
+    assert cached_call(first) == 1
+    assert cached_call(second) == 2
+
+
+def test_cache_unhashable_and_non_str_keys(cached_call):
+    """Test that dicts with non-str keys and lists are cached, not rejected."""
+    assert cached_call({1: "x"}, items=[1, 2]) == 1
+    assert cached_call({1: "x"}, items=[1, 2]) == 1
+    assert cached_call({1: "y"}, items=[1, 2]) == 2
+    assert len(cached_call.calls) == 2
+
+
+def test_cache_kwargs_order_does_not_matter(cached_call):
+    """Test that keyword order does not split the cache."""
+    assert cached_call(a=1, b=2) == 1
+    assert cached_call(b=2, a=1) == 1
+
+
+class FakeResponse:
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Stands in for the pooled requests.Session and records GET calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return FakeResponse()
+
+
+def test_get_caches_non_str_param_keys(monkeypatch):
+    """Test that get() accepts the params requests accepts and caches the response."""
+    wt = WebTools()
+    session = FakeSession()
+    monkeypatch.setattr(wt, "_get_session", lambda: session)
+
+    first = wt.get("http://example.test", params={1: "x"})
+    assert wt.get("http://example.test", params={1: "x"}) is first
+    wt.get("http://example.test", params={1: "y"})
+    assert [kwargs["params"] for _, kwargs in session.calls] == [{1: "x"}, {1: "y"}]